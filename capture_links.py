@@ -2,20 +2,59 @@
 
 import argparse
 import asyncio
+import heapq
+import json
 import logging
+from pathlib import Path
 
-from src.core.browser_helper import BrowserHelper
-from src.core.odds_portal_market_extractor import OddsPortalMarketExtractor
-from src.core.odds_portal_scraper import OddsPortalScraper
-from src.core.playwright_manager import PlaywrightManager
-from src.core.sport_market_registry import SportMarketRegistrar
 from src.core.url_builder import URLBuilder
 from src.utils.setup_logging import setup_logger
 
+DEFAULT_PAGINATION_CACHE_PATH = Path(__file__).resolve().parent / "capturelinks" / ".pagination_cache.json"
+DEFAULT_STORAGE_STATE_PATH = Path(__file__).resolve().parent / "capturelinks" / ".storage_state.json"
+DEFAULT_ESTIMATED_PAGES = 10
+
 
 def _split_csv_argument(raw: str) -> list[str]:
-    """Split a comma-separated argument into a cleaned list."""
-    return [item.strip() for item in raw.split(",") if item.strip()]
+    """Split a comma-separated argument into a cleaned list, dropping empty and duplicate entries."""
+    return list(dict.fromkeys(filter(None, (item.strip() for item in raw.split(",")))))
+
+
+def _pagination_cache_key(sport: str, league: str, season: str) -> str:
+    return f"{sport}/{league}/{season}"
+
+
+def _load_pagination_cache(path: Path) -> dict[str, int]:
+    """Load page counts observed in previous runs, keyed by sport/league/season."""
+    try:
+        with path.open(encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_pagination_cache(path: Path, cache: dict[str, int]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+class _LongestJobQueue:
+    """
+    Hands out (league, season) jobs longest-estimated-first (LPT scheduling), so that seasons with many
+    pages start early instead of becoming stragglers at the end of the run.
+    """
+
+    def __init__(self, estimated_jobs: list[tuple[int, tuple[str, str]]]):
+        # The insertion index breaks ties so that equal-cost jobs keep their submission order.
+        self._heap = [(-cost, index, job) for index, (cost, job) in enumerate(estimated_jobs)]
+        heapq.heapify(self._heap)
+
+    def pop_longest(self) -> tuple[str, str] | None:
+        if not self._heap:
+            return None
+        return heapq.heappop(self._heap)[2]
 
 
 def parse_args() -> argparse.Namespace:
@@ -60,11 +99,41 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional timezone ID for the Playwright browser (e.g., Europe/Paris).",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help=(
+            "Number of league/season jobs to capture in parallel, each in its own browser context (default: 1). "
+            "Parallel jobs interleave their log lines, which capture_links_control.py cannot attribute."
+        ),
+    )
+    parser.add_argument(
+        "--pagination-cache",
+        type=Path,
+        default=DEFAULT_PAGINATION_CACHE_PATH,
+        help="JSON file remembering page counts per league/season, used to schedule the longest jobs first.",
+    )
+    parser.add_argument(
+        "--storage-state",
+        type=Path,
+        default=DEFAULT_STORAGE_STATE_PATH,
+        help="Browser storage state (cookies, local storage) loaded at start and saved at the end of the run.",
+    )
 
     return parser.parse_args()
 
 
 async def capture_links(args: argparse.Namespace) -> None:
+    # Playwright and the scraper stack are imported here so that --help and argument errors stay fast
+    from playwright.async_api import BrowserContext
+
+    from src.core.browser_helper import BrowserHelper
+    from src.core.odds_portal_market_extractor import OddsPortalMarketExtractor
+    from src.core.odds_portal_scraper import OddsPortalScraper
+    from src.core.playwright_manager import PlaywrightManager
+    from src.core.sport_market_registry import SportMarketRegistrar
+
     logger = logging.getLogger("CaptureLinks")
 
     leagues = _split_csv_argument(args.leagues)
@@ -94,35 +163,83 @@ async def capture_links(args: argparse.Namespace) -> None:
         browser_timezone_id=args.browser_timezone_id,
     )
 
-    try:
-        current_page = playwright_manager.page
-        if current_page is None:
-            raise RuntimeError("Playwright page was not initialized correctly.")
-
-        for league in leagues:
-            for season in seasons:
-                logger.info("Capturing links for sport=%s league=%s season=%s", args.sport, league, season)
-
-                base_url = URLBuilder.get_historic_matches_url(
-                    sport=args.sport,
-                    league=league,
-                    season=season,
-                )
+    concurrency = max(1, args.concurrency)
+    pagination_cache = _load_pagination_cache(args.pagination_cache)
+    default_estimate = args.max_pages or DEFAULT_ESTIMATED_PAGES
+
+    estimated_jobs = []
+    for league in leagues:
+        for season in seasons:
+            estimate = pagination_cache.get(_pagination_cache_key(args.sport, league, season), default_estimate)
+            if args.max_pages:
+                estimate = min(estimate, args.max_pages)
+            estimated_jobs.append((estimate, (league, season)))
+
+    job_queue = _LongestJobQueue(estimated_jobs)
+    extra_contexts: list[BrowserContext] = []
+
+    async def capture_job(context: BrowserContext, league: str, season: str) -> None:
+        page = None
+        try:
+            logger.info("Capturing links for sport=%s league=%s season=%s", args.sport, league, season)
+
+            base_url = URLBuilder.get_historic_matches_url(
+                sport=args.sport,
+                league=league,
+                season=season,
+            )
+
+            page = await context.new_page()
+            await page.goto(base_url, timeout=20000, wait_until="domcontentloaded")
+            await scraper._prepare_page_for_scraping(page=page)
+
+            pages_to_scrape = await scraper._get_pagination_info(
+                page=page,
+                max_pages=args.max_pages,
+            )
+            cache_key = _pagination_cache_key(args.sport, league, season)
+            if args.max_pages:
+                # A capped count is only a lower bound: keep a larger count seen by an uncapped run
+                pagination_cache[cache_key] = max(pagination_cache.get(cache_key, 0), len(pages_to_scrape))
+            else:
+                pagination_cache[cache_key] = len(pages_to_scrape)
+
+            await scraper._collect_match_links(base_url=base_url, pages_to_scrape=pages_to_scrape, context=context)
+
+            logger.info("Finished capturing links for %s %s %s", args.sport, league, season)
+
+        except Exception as e:
+            logger.error("Failed to capture links for %s %s %s: %s", args.sport, league, season, e)
+
+        finally:
+            if page:
+                await page.close()
+
+    async def worker(context: BrowserContext) -> None:
+        while (job := job_queue.pop_longest()) is not None:
+            await capture_job(context, *job)
 
-                await current_page.goto(base_url, timeout=20000, wait_until="domcontentloaded")
-                await scraper._prepare_page_for_scraping(page=current_page)
-
-                pages_to_scrape = await scraper._get_pagination_info(
-                    page=current_page,
-                    max_pages=args.max_pages,
-                )
-
-                await scraper._collect_match_links(base_url=base_url, pages_to_scrape=pages_to_scrape)
+    try:
+        contexts = [await playwright_manager.get_or_create_context(storage_state_path=args.storage_state)]
+        for _ in range(min(concurrency, len(estimated_jobs)) - 1):
+            context = await playwright_manager.new_context()
+            extra_contexts.append(context)
+            contexts.append(context)
 
-                logger.info("Finished capturing links for %s %s %s", args.sport, league, season)
+        await asyncio.gather(*(worker(context) for context in contexts))
 
     finally:
+        for context in extra_contexts:
+            await context.close()
+        try:
+            await playwright_manager.save_storage_state(args.storage_state)
+        except Exception as e:
+            logger.warning("Could not save browser storage state to %s: %s", args.storage_state, e)
         await scraper.stop_playwright()
+        try:
+            _save_pagination_cache(args.pagination_cache, pagination_cache)
+        except OSError as e:
+            logger.warning("Could not save pagination cache to %s: %s", args.pagination_cache, e)
 
 
 def main() -> None:
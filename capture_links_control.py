@@ -2,42 +2,41 @@ import tkinter as tk
 from tkinter import scrolledtext, messagebox
 import re
 
+# Sezon bloğu başlangıcı (örn: "Capturing links for ... season=2014-2015"), pagination sayısı
+# (örn: "Found 9 pagination links") ve toplam link sayısı (örn: "Total links found: 380")
+LOG_EVENT_RE = re.compile(
+    r"Capturing links for.*?season=(?P<season>\d{4}-\d{4})"
+    r"|Found (?P<pag>\d+) pagination links"
+    r"|Total links found: (?P<links>\d+)"
+)
+
 def parse_log():
     log_text = text_area.get("1.0", tk.END).strip()
     if not log_text:
         messagebox.showwarning("Uyarı", "Lütfen log metnini yapıştırın.")
         return
 
-    # Her sezon bloğunu bulmak için başlangıç noktası: "Capturing links for ... season=XXXX-XXXX"
-    season_blocks = re.split(r"(?=Capturing links for.*season=\d{4}-\d{4})", log_text)
-
+    # Tek geçişte sezon başlangıçlarını, pagination ve toplam link satırlarını tara.
+    # Satırlar en son sezon başlığına atanır; bu yüzden log `--concurrency 1` ile alınmış olmalıdır.
     results = []
+    current = None
 
-    for block in season_blocks:
-        # Sezonu çıkar
-        season_match = re.search(r"season=(\d{4}-\d{4})", block)
-        if not season_match:
+    for match in LOG_EVENT_RE.finditer(log_text):
+        if match.group("season"):
+            current = {"season": match.group("season"), "pagination_pages": None, "total_links": None}
+            results.append(current)
+        elif current is None:
             continue
-        season = season_match.group(1)
-
-        # Pagination sayısını bul (örn: "Found 9 pagination links")
-        pag_match = re.search(r"Found (\d+) pagination links", block)
-        pagination_pages = int(pag_match.group(1)) if pag_match else 0
-
-        # Toplam link sayısını bul (örn: "Total links found: 380")
-        link_match = re.search(r"Total links found: (\d+)", block)
-        total_links = int(link_match.group(1)) if link_match else 0
-
-        results.append({
-            "season": season,
-            "pagination_pages": pagination_pages,
-            "total_links": total_links
-        })
+        # Her blokta yalnızca ilk eşleşme dikkate alınır
+        elif match.group("pag") and current["pagination_pages"] is None:
+            current["pagination_pages"] = int(match.group("pag"))
+        elif match.group("links") and current["total_links"] is None:
+            current["total_links"] = int(match.group("links"))
 
     # Sonuçları formatla
     output = ""
     for res in results:
-        output += f"Sezon: {res['season']} → Pagination Sayfası: {res['pagination_pages']}, Toplam Link: {res['total_links']}\n"
+        output += f"Sezon: {res['season']} → Pagination Sayfası: {res['pagination_pages'] or 0}, Toplam Link: {res['total_links'] or 0}\n"
 
     if output:
         result_text.config(state='normal')
@@ -1,26 +1,64 @@
+from __future__ import annotations
+
 import argparse
+import asyncio
 import csv
 import logging
-import random
-import re
 import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Final, TextIO
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-
 from src.core.url_builder import URLBuilder
 from src.utils.constants import ODDSPORTAL_BASE_URL
 
+# Selenium and selectolax are imported inside the functions that use them so that --help and argument
+# errors do not pay for loading the whole WebDriver stack
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+_SEL_EVENT_ROW: Final[str] = "div[class*='eventRow']"
+# Anchors inside any element having a class token that starts with "eventRow", selected in a single pass
+_SEL_EVENT_ROW_LINK: Final[str] = '[class^="eventRow"] a[href], [class*=" eventRow"] a[href]'
+_SEL_ODDS_BTN: Final[str] = "div.group > button.gap-2"
+_SEL_ODDS_OPTION: Final[str] = "div.group > div.dropdown-content > ul > li > a"
+_SEL_PAGINATION_LINK: Final[str] = "a.pagination-link"
+_SEL_PAGINATION_ANY: Final[str] = "a.pagination-link, nav[class*='pagination'], ul[class*='pagination']"
+_SEL_PAGINATION_NUMBER: Final[str] = (
+    "a.pagination-link:not([rel='next']), nav[class*='pagination'] a, ul[class*='pagination'] a"
+)
+_SEL_COOKIE_BUTTONS: Final[tuple[str, ...]] = (
+    "button#onetrust-accept-btn-handler",
+    "button[aria-label*='Accept']",
+    "button:contains('Accept')",
+    "button:contains('I agree')",
+    "button:contains('Got it')",
+)
+
+# Image and font requests blocked through CDP; they dominate page weight and are not needed for scraping
+_BLOCKED_RESOURCE_URLS: Final[list[str]] = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.woff2",
+    "*.woff",
+    "*.ttf",
+]
+
+# Minimum delay between two pagination clicks, as light pacing towards the site
+_MIN_PAGE_INTERVAL: Final[float] = 0.5
+
 
 def _split_csv_argument(raw: str) -> list[str]:
-    return [item.strip() for item in raw.split(",") if item.strip()]
+    # Duplicates are dropped (keeping first-seen order) so a repeated slug is not scraped twice
+    return list(dict.fromkeys(filter(None, (item.strip() for item in raw.split(",")))))
 
 
 def parse_args() -> argparse.Namespace:
@@ -33,11 +71,17 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--browser-user-agent", type=str, default=None)
     parser.add_argument("--browser-locale-timezone", type=str, default=None)
     parser.add_argument("--browser-timezone-id", type=str, default=None)
+    parser.add_argument("--concurrency", type=int, default=1, help="Number of Chrome drivers scraping in parallel.")
     return parser.parse_args()
 
 
 def build_driver(headless: bool, user_agent: str | None, locale: str | None, timezone_id: str | None) -> webdriver.Chrome:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
     chrome_options = Options()
+    # Return from driver.get() at DOMContentLoaded instead of waiting for ads, trackers and other sub-resources
+    chrome_options.page_load_strategy = "eager"
     if headless:
         chrome_options.add_argument("--headless=new")
     chrome_options.add_argument("--disable-gpu")
@@ -46,10 +90,18 @@ def build_driver(headless: bool, user_agent: str | None, locale: str | None, tim
     chrome_options.add_argument("--window-size=1920,1080")
     if user_agent:
         chrome_options.add_argument(f"--user-agent={user_agent}")
+    # Only the DOM is needed to read pagination and match links, so skip downloading images
+    prefs = {"profile.managed_default_content_settings.images": 2}
     if locale:
         chrome_options.add_argument(f"--lang={locale}")
-        chrome_options.add_experimental_option("prefs", {"intl.accept_languages": locale})
+        prefs["intl.accept_languages"] = locale
+    chrome_options.add_experimental_option("prefs", prefs)
     driver = webdriver.Chrome(options=chrome_options)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_RESOURCE_URLS})
+    except Exception:
+        pass
     if timezone_id:
         try:
             driver.execute_cdp_cmd("Emulation.setTimezoneOverride", {"timezoneId": timezone_id})
@@ -59,23 +111,18 @@ def build_driver(headless: bool, user_agent: str | None, locale: str | None, tim
     return driver
 
 
-def dismiss_cookie_banner(driver: webdriver.Chrome, timeout: int = 10) -> None:
-    selectors = [
-        "button#onetrust-accept-btn-handler",
-        "button[aria-label*='Accept']",
-        "button:contains('Accept')",
-        "button:contains('I agree')",
-        "button:contains('Got it')",
-    ]
+def dismiss_cookie_banner(driver: webdriver.Chrome, timeout: int = 10) -> bool:
+    from selenium.webdriver.common.by import By
+
     end_time = time.time() + timeout
     while time.time() < end_time:
         try:
-            for sel in selectors:
+            for sel in _SEL_COOKIE_BUTTONS:
                 try:
                     el = driver.find_element(By.CSS_SELECTOR, sel)
                     if el.is_displayed():
                         el.click()
-                        return
+                        return True
                 except Exception:
                     continue
             buttons = driver.find_elements(By.TAG_NAME, "button")
@@ -84,57 +131,110 @@ def dismiss_cookie_banner(driver: webdriver.Chrome, timeout: int = 10) -> None:
                     txt = (b.text or "").strip().lower()
                     if any(k in txt for k in ["accept", "agree", "consent", "ok", "got it"]):
                         b.click()
-                        return
+                        return True
                 except Exception:
                     continue
         except Exception:
             pass
         time.sleep(0.5)
+    return False
+
 
+def set_odds_format(driver: webdriver.Chrome, timeout: int = 10) -> bool:
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
 
-def set_odds_format(driver: webdriver.Chrome, timeout: int = 10) -> None:
     try:
         WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div.group > button.gap-2"))
+            EC.presence_of_element_located((By.CSS_SELECTOR, _SEL_ODDS_BTN))
         )
-        btn = driver.find_element(By.CSS_SELECTOR, "div.group > button.gap-2")
+        btn = driver.find_element(By.CSS_SELECTOR, _SEL_ODDS_BTN)
         current = (btn.text or "").strip()
         if current.lower().startswith("decimal"):
-            return
+            return True
         btn.click()
         time.sleep(1.0)
-        options = driver.find_elements(By.CSS_SELECTOR, "div.group > div.dropdown-content > ul > li > a")
+        options = driver.find_elements(By.CSS_SELECTOR, _SEL_ODDS_OPTION)
         for opt in options:
             t = (opt.text or "").strip().lower()
             if "decimal" in t:
                 opt.click()
                 time.sleep(1.0)
-                return
+                return True
     except Exception:
         pass
+    return False
 
 
 def wait_dom_loaded(driver: webdriver.Chrome, timeout: int = 20) -> None:
+    from selenium.webdriver.support.ui import WebDriverWait
+
     WebDriverWait(driver, timeout).until(
         lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
     )
 
 
-def scroll_until_loaded(driver: webdriver.Chrome, content_selector: str, timeout: int = 30, scroll_pause_time: float = 1.5, max_scroll_attempts: int = 3) -> bool:
+# Resolves once the DOM has gone `quietMs` without mutations (true) or after `maxWaitMs` (false).
+_WAIT_FOR_DOM_QUIET_JS: Final[str] = """
+const [quietMs, maxWaitMs, done] = arguments;
+let settled = false;
+let quietTimer = null;
+const observer = new MutationObserver(() => {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(() => finish(true), quietMs);
+});
+const hardTimer = setTimeout(() => finish(false), maxWaitMs);
+function finish(quiet) {
+    if (settled) return;
+    settled = true;
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(hardTimer);
+    done(quiet);
+}
+observer.observe(document.body, {childList: true, subtree: true});
+quietTimer = setTimeout(() => finish(true), quietMs);
+"""
+
+
+def wait_for_dom_quiet(driver: webdriver.Chrome, quiet_period: float = 0.3, max_wait: float = 2.0) -> bool:
+    try:
+        return bool(
+            driver.execute_async_script(_WAIT_FOR_DOM_QUIET_JS, int(quiet_period * 1000), int(max_wait * 1000))
+        )
+    except Exception:
+        # Fall back to a plain pause if the script could not run (e.g. document.body not ready yet)
+        time.sleep(quiet_period)
+        return False
+
+
+_SCROLL_STATE_JS: Final[str] = "return [document.body.scrollHeight, document.querySelector(arguments[0]) !== null];"
+
+
+def scroll_until_loaded(
+    driver: webdriver.Chrome,
+    content_selector: str,
+    timeout: int = 30,
+    scroll_pause_time: float = 1.5,
+    max_scroll_attempts: int = 3,
+    quiet_period: float = 0.3,
+) -> bool:
     end_time = time.time() + timeout
     last_height = driver.execute_script("return document.body.scrollHeight")
     attempts = 0
     content_seen = False
     while time.time() < end_time:
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(scroll_pause_time)
-        new_height = driver.execute_script("return document.body.scrollHeight")
+        # Wait only as long as the DOM keeps changing, capped at scroll_pause_time
+        wait_for_dom_quiet(driver, quiet_period=quiet_period, max_wait=scroll_pause_time)
+        # Page height and content presence are read in the same round trip
         try:
-            elems = driver.find_elements(By.CSS_SELECTOR, content_selector)
-            if elems:
+            new_height, has_content = driver.execute_script(_SCROLL_STATE_JS, content_selector)
+            if has_content:
                 content_seen = True
         except Exception:
-            pass
+            new_height = last_height
 
         if new_height == last_height:
             attempts += 1
@@ -144,94 +244,137 @@ def scroll_until_loaded(driver: webdriver.Chrome, content_selector: str, timeout
         else:
             attempts = 0
             last_height = new_height
-    
+
     return True
 
 
-def wait_for_hash(driver: webdriver.Chrome, expected_hash: str, timeout: int = 10) -> bool:
-    end_time = time.time() + timeout
-    while time.time() < end_time:
-        try:
-            current_hash = driver.execute_script("return window.location.hash || ''")
-            if current_hash == expected_hash:
-                return True
-        except Exception:
-            pass
-        time.sleep(0.2)
-    return False
+# URL hash, row count and first match-link href (a signature of the page content), gathered in one
+# CDP round trip; returnByValue hands the object back as plain JSON
+_PAGE_STATE_EXPRESSION: Final[str] = """(() => {
+    const links = document.querySelectorAll("$EVENT_ROW a[href]");
+    let sig = "";
+    for (const a of links) {
+        // A match link usually contains more than 3 path segments
+        if (a.href.replace(/^\\/+|\\/+$/g, "").split("/").length > 3) {
+            sig = a.href;
+            break;
+        }
+    }
+    return {hash: location.hash, rows: document.querySelectorAll("$EVENT_ROW").length, sig: sig};
+})()""".replace("$EVENT_ROW", _SEL_EVENT_ROW)
 
 
-def wait_for_event_rows(driver: webdriver.Chrome, timeout: int = 10) -> bool:
-    end_time = time.time() + timeout
-    while time.time() < end_time:
-        try:
-            elems = driver.find_elements(By.CSS_SELECTOR, "div[class*='eventRow']")
-            if elems:
-                return True
-        except Exception:
-            pass
-        time.sleep(0.3)
-    return False
+def _poll_page_state(driver: webdriver.Chrome) -> dict:
+    try:
+        response = driver.execute_cdp_cmd(
+            "Runtime.evaluate", {"expression": _PAGE_STATE_EXPRESSION, "returnByValue": True}
+        )
+        return response.get("result", {}).get("value") or {}
+    except Exception:
+        return {}
+
+
+def wait_for_page_state(
+    driver: webdriver.Chrome, expected_hash: str | None = None, previous_signature: str | None = None, timeout: int = 10
+) -> str | None:
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    # Wait until the hash matches (if given), event rows are rendered and their first match link differs
+    # from previous_signature; returns the new signature
+    def page_ready(d: webdriver.Chrome) -> str | None:
+        state = _poll_page_state(d)
+        if expected_hash is not None and state.get("hash") != expected_hash:
+            return None
+        sig = state.get("sig")
+        if state.get("rows") and sig and sig != previous_signature:
+            return sig
+        return None
 
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.2).until(page_ready)
+    except TimeoutException:
+        return None
 
-def extract_match_links_from_html(html: str) -> list[str]:
-    soup = BeautifulSoup(html, "lxml")
-    event_rows = soup.find_all(class_=re.compile("^eventRow"))
-    links = {
-        f"{ODDSPORTAL_BASE_URL}{a['href']}"
-        for row in event_rows
-        for a in row.find_all("a", href=True)
-        if len(a["href"].strip("/").split("/")) > 3
-    }
+
+def _to_match_links(hrefs: Iterable[str | None]) -> list[str]:
+    # A match link usually contains more than 3 path segments
+    links = {f"{ODDSPORTAL_BASE_URL}{href}" for href in hrefs if href and len(href.strip("/").split("/")) > 3}
     return list(links)
 
 
-def get_first_event_signature(driver: webdriver.Chrome) -> str | None:
+def extract_match_links_from_html(html: str) -> list[str]:
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
+    return _to_match_links(node.attributes.get("href") for node in tree.css(_SEL_EVENT_ROW_LINK))
+
+
+_EVENT_ROW_HREFS_JS: Final[str] = (
+    "return Array.from(document.querySelectorAll(arguments[0]), (a) => a.getAttribute('href'));"
+)
+
+
+def extract_match_links(driver: webdriver.Chrome) -> list[str]:
+    # Collect hrefs in the browser rather than serializing the whole DOM through page_source
     try:
-        # Try to capture the first event link href as a signature of page content
-        elems = driver.find_elements(By.CSS_SELECTOR, "div[class*='eventRow'] a[href]")
-        for el in elems:
-            href = el.get_attribute("href") or ""
-            # A match link usually contains more than 3 segments
-            try:
-                if len(href.strip("/").split("/")) > 3:
-                    return href
-            except Exception:
-                continue
+        hrefs = driver.execute_script(_EVENT_ROW_HREFS_JS, _SEL_EVENT_ROW_LINK)
     except Exception:
-        pass
-    return None
+        return extract_match_links_from_html(driver.page_source)
+    return _to_match_links(hrefs or [])
+
+
+# Clicks the pagination link for the target page (or sets the hash if there is none) and resolves once
+# location.hash reaches "#/page/<target>", or with false after timeoutMs
+_NAVIGATE_TO_PAGE_JS: Final[str] = """
+const [target, timeoutMs, selector, done] = arguments;
+const expected = "#/page/" + target;
+let settled = false;
+const finish = (ok) => {
+    if (settled) return;
+    settled = true;
+    clearTimeout(timer);
+    clearInterval(poll);
+    window.removeEventListener("hashchange", onHashChange);
+    done(ok);
+};
+const onHashChange = () => {
+    if (location.hash === expected) finish(true);
+};
+window.addEventListener("hashchange", onHashChange);
+// Cheap in-page fallback for routers that update the URL without firing hashchange
+const poll = setInterval(onHashChange, 100);
+const timer = setTimeout(() => finish(location.hash === expected), timeoutMs);
+const link = Array.from(document.querySelectorAll(selector)).find((a) => a.textContent.trim() === String(target));
+if (link) {
+    link.click();
+} else {
+    location.hash = expected;
+}
+onHashChange();
+"""
+
+
+def navigate_to_page(driver: webdriver.Chrome, target_page: int, timeout: int = 12) -> bool:
+    try:
+        return bool(
+            driver.execute_async_script(_NAVIGATE_TO_PAGE_JS, target_page, int(timeout * 1000), _SEL_PAGINATION_LINK)
+        )
+    except Exception:
+        return False
 
 
-def navigate_to_page(driver: webdriver.Chrome, target_page: int, timeout: int = 12) -> None:
-    # Try clicking the pagination link with exact page text
-    end_time = time.time() + timeout
-    attempted_js_hash = False
-    while time.time() < end_time:
-        try:
-            # Ensure pagination is in DOM
-            page_links = driver.find_elements(By.CSS_SELECTOR, "a.pagination-link")
-            for a in page_links:
-                txt = (a.text or "").strip()
-                if txt.isdigit() and int(txt) == target_page:
-                    try:
-                        driver.execute_script("arguments[0].click();", a)
-                    except Exception:
-                        a.click()
-                    return
-        except Exception:
-            pass
-        # As a fallback, try setting the hash directly once
-        if not attempted_js_hash:
-            try:
-                driver.execute_script("window.location.hash = arguments[0];", f"#/page/{target_page}")
-                attempted_js_hash = True
-            except Exception:
-                pass
-        time.sleep(0.3)
+_PAGINATION_NUMBERS_JS: Final[str] = (
+    "return Array.from(document.querySelectorAll(arguments[0]), (e) => e.textContent.trim())"
+    ".filter((t) => /^\\d+$/.test(t)).map(Number);"
+)
 
 
 def get_pagination_pages(driver: webdriver.Chrome, max_pages: int | None) -> list[int]:
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
     try:
         # Give the page a moment and a short scroll to trigger dynamic pagination render
         try:
@@ -246,7 +389,7 @@ def get_pagination_pages(driver: webdriver.Chrome, max_pages: int | None) -> lis
                 EC.presence_of_any_elements_located(
                     (
                         By.CSS_SELECTOR,
-                        "a.pagination-link, nav[class*='pagination'], ul[class*='pagination']",
+                        _SEL_PAGINATION_ANY,
                     )
                 )
             )
@@ -254,33 +397,11 @@ def get_pagination_pages(driver: webdriver.Chrome, max_pages: int | None) -> lis
             # continue with best-effort parsing
             pass
 
-        pages: list[int] = []
-
-        # First, try via direct elements
+        # Page numbers from every pagination flavour, read in a single in-browser query
         try:
-            link_elems = driver.find_elements(By.CSS_SELECTOR, "a.pagination-link:not([rel='next'])")
-            for elem in link_elems:
-                try:
-                    t = (elem.text or "").strip()
-                    if t.isdigit():
-                        pages.append(int(t))
-                except Exception:
-                    continue
+            pages: list[int] = driver.execute_script(_PAGINATION_NUMBERS_JS, _SEL_PAGINATION_NUMBER) or []
         except Exception:
-            pass
-
-        # Fallback: parse the page HTML for pagination numbers
-        if not pages:
-            try:
-                html = driver.page_source
-                soup = BeautifulSoup(html, "lxml")
-                containers = soup.select("a.pagination-link, nav[class*='pagination'], ul[class*='pagination'] a")
-                for c in containers:
-                    txt = (c.get_text() or "").strip()
-                    if txt.isdigit():
-                        pages.append(int(txt))
-            except Exception:
-                pass
+            pages = []
 
         if not pages:
             return [1]
@@ -295,9 +416,7 @@ def get_pagination_pages(driver: webdriver.Chrome, max_pages: int | None) -> lis
         return [1]
 
 
-def save_collected_links(base_url: str, links: list[str]) -> None:
-    if not links:
-        return
+def collected_links_path(base_url: str) -> Path:
     project_root = Path(__file__).resolve().parent
     capture_dir = project_root / "capturelinks"
     capture_dir.mkdir(parents=True, exist_ok=True)
@@ -305,12 +424,174 @@ def save_collected_links(base_url: str, links: list[str]) -> None:
     base_slug = parsed_url.path.strip("/") or "links"
     sanitized_slug = base_slug.replace("/", "_").replace(" ", "-")
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_path = capture_dir / f"{sanitized_slug}_{timestamp}.csv"
-    with file_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["match_link"])
-        for link in sorted(set(links)):
-            writer.writerow([link])
+    return capture_dir / f"{sanitized_slug}_{timestamp}.csv"
+
+
+class CollectedLinksWriter:
+    # Appends unique links to the capture CSV as pages complete; the file is only created once a link arrives
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.written: set[str] = set()
+        self._file: TextIO | None = None
+        self._writer = None
+
+    def write(self, links: Iterable[str]) -> int:
+        new_links = [link for link in dict.fromkeys(links) if link not in self.written]
+        if not new_links:
+            return 0
+        if self._file is None:
+            self._file = collected_links_path(self.base_url).open("w", newline="", encoding="utf-8")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(["match_link"])
+        self._writer.writerows([link] for link in new_links)
+        # Flush per page so links already captured survive a crash later in the season
+        self._file.flush()
+        self.written.update(new_links)
+        return len(new_links)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> CollectedLinksWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+@dataclass
+class DriverSession:
+    driver: webdriver.Chrome
+    # One-time page setup already done in this browser session
+    cookies_dismissed: bool = False
+    odds_format_set: bool = False
+
+
+class DriverPool:
+    # Keeps warm Chrome sessions for reuse across jobs; drivers are started lazily, on first demand
+
+    def __init__(self, driver_factory: Callable[[], webdriver.Chrome]):
+        self._driver_factory = driver_factory
+        self._idle: deque[DriverSession] = deque()
+        self._sessions: list[DriverSession] = []
+
+    def acquire(self) -> DriverSession:
+        try:
+            return self._idle.pop()
+        except IndexError:
+            session = DriverSession(driver=self._driver_factory())
+            self._sessions.append(session)
+            return session
+
+    def release(self, session: DriverSession) -> None:
+        self._idle.append(session)
+
+    def close_all(self) -> None:
+        for session in self._sessions:
+            try:
+                session.driver.quit()
+            except Exception:
+                pass
+        self._sessions.clear()
+        self._idle.clear()
+
+
+def _pace(last_action: float, min_interval: float = _MIN_PAGE_INTERVAL) -> float:
+    # Keep at least min_interval seconds between page navigations without idling once pages are slow enough
+    time.sleep(max(0.0, min_interval - (time.monotonic() - last_action)))
+    return time.monotonic()
+
+
+def _scrape_one(
+    session: DriverSession, league: str, season: str, args: argparse.Namespace, logger: logging.Logger
+) -> None:
+    driver = session.driver
+    logger.info(f"Capturing links for sport={args.sport} league={league} season={season}")
+    base_url = URLBuilder.get_historic_matches_url(
+        sport=args.sport,
+        league=league,
+        season=season,
+    )
+    driver.get(base_url)
+    wait_dom_loaded(driver, timeout=20)
+    # Both settings persist for the lifetime of the driver session
+    if not session.cookies_dismissed:
+        session.cookies_dismissed = dismiss_cookie_banner(driver, timeout=8)
+    if not session.odds_format_set:
+        session.odds_format_set = set_odds_format(driver, timeout=8)
+    # Small wait to ensure React pagination is rendered
+    time.sleep(1.0)
+    pages_to_scrape = get_pagination_pages(driver, max_pages=args.max_pages)
+    last_navigation = time.monotonic()
+    with CollectedLinksWriter(base_url) as links_writer:
+        for i, page_number in enumerate(pages_to_scrape, 1):
+            try:
+                logger.info(f"[{i}/{len(pages_to_scrape)}] Navigating to page {page_number}")
+                # Ensure event rows are present on initial page
+                prev_sig = wait_for_page_state(driver, timeout=10)
+
+                if page_number != 1:
+                    last_navigation = _pace(last_navigation)
+                    navigate_to_page(driver, target_page=page_number, timeout=12)
+                    # Wait for the new hash and for rows whose content signature changed
+                    wait_for_page_state(
+                        driver,
+                        expected_hash=f"#/page/{page_number}",
+                        previous_signature=prev_sig,
+                        timeout=20,
+                    )
+
+                scroll_until_loaded(
+                    driver,
+                    content_selector=_SEL_EVENT_ROW,
+                    timeout=30,
+                    scroll_pause_time=2,
+                    max_scroll_attempts=3,
+                )
+                links = extract_match_links(driver)
+                links_writer.write(links)
+            except Exception as e:
+                logger.error(f"Error on page {page_number}: {e}")
+
+
+async def _capture_links_async(args: argparse.Namespace, jobs: list[tuple[str, str]], logger: logging.Logger) -> None:
+    pool = DriverPool(
+        lambda: build_driver(
+            headless=args.headless,
+            user_agent=args.browser_user_agent,
+            locale=args.browser_locale_timezone,
+            timezone_id=args.browser_timezone_id,
+        )
+    )
+    queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+    for job in jobs:
+        queue.put_nowait(job)
+
+    async def worker() -> None:
+        # All jobs are queued up front, so an empty queue means this worker is done
+        while not queue.empty():
+            league, season = queue.get_nowait()
+            session = None
+            try:
+                # Starting a driver can fail too; that only fails this job, not the other workers
+                session = await asyncio.to_thread(pool.acquire)
+                await asyncio.to_thread(_scrape_one, session, league, season, args, logger)
+            except Exception as e:
+                logger.error(f"Failed to capture links for league={league} season={season}: {e}")
+            finally:
+                if session is not None:
+                    pool.release(session)
+
+    try:
+        # Wait for every worker before closing the pool, so no driver is quit while a thread still uses it
+        await asyncio.gather(
+            *(worker() for _ in range(min(max(1, args.concurrency), len(jobs)))), return_exceptions=True
+        )
+    finally:
+        pool.close_all()
 
 
 def capture_links_selenium(args: argparse.Namespace) -> None:
@@ -322,70 +603,8 @@ def capture_links_selenium(args: argparse.Namespace) -> None:
     if not seasons:
         raise ValueError("At least one season must be provided via --seasons.")
 
-    driver = build_driver(
-        headless=args.headless,
-        user_agent=args.browser_user_agent,
-        locale=args.browser_locale_timezone,
-        timezone_id=args.browser_timezone_id,
-    )
-
-    try:
-        for league in leagues:
-            for season in seasons:
-                logger.info(f"Capturing links for sport={args.sport} league={league} season={season}")
-                base_url = URLBuilder.get_historic_matches_url(
-                    sport=args.sport,
-                    league=league,
-                    season=season,
-                )
-                driver.get(base_url)
-                wait_dom_loaded(driver, timeout=20)
-                dismiss_cookie_banner(driver, timeout=8)
-                set_odds_format(driver, timeout=8)
-                # Small wait to ensure React pagination is rendered
-                time.sleep(1.0)
-                pages_to_scrape = get_pagination_pages(driver, max_pages=args.max_pages)
-                all_links: list[str] = []
-                for i, page_number in enumerate(pages_to_scrape, 1):
-                    try:
-                        logger.info(f"[{i}/{len(pages_to_scrape)}] Navigating to page {page_number}")
-                        # Ensure event rows are present on initial page
-                        wait_for_event_rows(driver, timeout=10)
-                        prev_sig = get_first_event_signature(driver)
-
-                        if page_number != 1:
-                            navigate_to_page(driver, target_page=page_number, timeout=12)
-                            # Wait for hash and rows
-                            wait_for_hash(driver, expected_hash=f"#/page/{page_number}", timeout=8)
-                            wait_for_event_rows(driver, timeout=10)
-                            # Wait for content signature to change
-                            sig_deadline = time.time() + 10
-                            while time.time() < sig_deadline:
-                                cur_sig = get_first_event_signature(driver)
-                                if cur_sig and cur_sig != prev_sig:
-                                    break
-                                time.sleep(0.3)
-
-                        time.sleep(random.randint(6, 8))
-                        scroll_until_loaded(
-                            driver,
-                            content_selector="div[class*='eventRow']",
-                            timeout=30,
-                            scroll_pause_time=2,
-                            max_scroll_attempts=3,
-                        )
-                        html = driver.page_source
-                        links = extract_match_links_from_html(html)
-                        all_links.extend(links)
-                    except Exception as e:
-                        logger.error(f"Error on page {page_number}: {e}")
-                unique_links = list(set(all_links))
-                save_collected_links(base_url=base_url, links=unique_links)
-    finally:
-        try:
-            driver.quit()
-        except Exception:
-            pass
+    jobs = [(league, season) for league in leagues for season in seasons]
+    asyncio.run(_capture_links_async(args, jobs, logger))
 
 
 def main() -> None:
@@ -23,36 +23,7 @@ class CLIArgumentHandler:
                 if isinstance(args.match_links, list) and len(args.match_links) == 1:
                     potential_path = Path(args.match_links[0])
                     if potential_path.exists() and potential_path.is_file():
-                        loaded_links: list[str] = []
-                        with potential_path.open("r", encoding="utf-8", newline="") as f:
-                            sample = f.read(2048)
-                            f.seek(0)
-                            # Try DictReader first to honor headers
-                            try:
-                                reader = csv.DictReader(f)
-                                if reader.fieldnames:
-                                    header_lower = [h.strip().lower() for h in reader.fieldnames if h]
-                                    key = "match_link" if "match_link" in header_lower else reader.fieldnames[0]
-                                    f.seek(0)
-                                    reader = csv.DictReader(f)
-                                    for row in reader:
-                                        val = (row.get(key) or "").strip()
-                                        if val:
-                                            loaded_links.append(val)
-                                else:
-                                    # Fall back to simple CSV reader
-                                    f.seek(0)
-                                    reader2 = csv.reader(f)
-                                    for row in reader2:
-                                        if row and row[0].strip():
-                                            loaded_links.append(row[0].strip())
-                            except Exception:
-                                # Fallback to simple reader if DictReader fails
-                                f.seek(0)
-                                reader2 = csv.reader(f)
-                                for row in reader2:
-                                    if row and row[0].strip():
-                                        loaded_links.append(row[0].strip())
+                        loaded_links = self._load_match_links_from_csv(potential_path)
 
                         # Replace args.match_links with the loaded list
                         args.match_links = loaded_links
@@ -114,3 +85,25 @@ class CLIArgumentHandler:
             "preview_submarkets_only": getattr(args, "preview_submarkets_only", False),
             "concurrency_tasks": getattr(args, "concurrency_tasks", None),
         }
+
+    def _load_match_links_from_csv(self, csv_path: Path) -> list[str]:
+        """
+        Read match links from a CSV file in a single pass.
+
+        The first line is treated as a header: links are read from the `match_link` column when present,
+        otherwise from the first column.
+        """
+        loaded_links: list[str] = []
+        with csv_path.open("r", encoding="utf-8", newline="") as f:
+            first_line = f.readline()
+            if not first_line:
+                return loaded_links
+
+            header_lower = [h.strip().lower() for h in next(csv.reader([first_line]), [])]
+            idx = header_lower.index("match_link") if "match_link" in header_lower else 0
+
+            for row in csv.reader(f):
+                if len(row) > idx and (val := row[idx].strip()):
+                    loaded_links.append(val)
+
+        return loaded_links
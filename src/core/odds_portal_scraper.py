@@ -5,7 +5,7 @@ import random
 from typing import Any
 from urllib.parse import urlparse
 
-from playwright.async_api import Page
+from playwright.async_api import BrowserContext, Page
 
 from src.core.base_scraper import BaseScraper
 from src.core.url_builder import URLBuilder
@@ -303,13 +303,17 @@ class OddsPortalScraper(BaseScraper):
             self.logger.info("No pagination gaps detected")
             return sorted_pages
 
-    async def _collect_match_links(self, base_url: str, pages_to_scrape: list[int]) -> list[str]:
+    async def _collect_match_links(
+        self, base_url: str, pages_to_scrape: list[int], context: BrowserContext | None = None
+    ) -> list[str]:
         """
         Collects match links from multiple pages.
 
         Args:
             base_url (str): The base URL of the historic matches.
             pages_to_scrape (List[int]): Pages to scrape.
+            context (Optional[BrowserContext]): Browser context used to open tabs. Defaults to the
+                context owned by the PlaywrightManager.
 
         Returns:
             List[str]: List of match links found.
@@ -317,6 +321,7 @@ class OddsPortalScraper(BaseScraper):
         self.logger.info(f"Starting collection of match links from {len(pages_to_scrape)} pages")
         self.logger.info(f"Pages to process: {pages_to_scrape}")
 
+        browser_context = context or self.playwright_manager.context
         all_links = []
         successful_pages = 0
         failed_pages = 0
@@ -325,7 +330,7 @@ class OddsPortalScraper(BaseScraper):
             self.logger.info(f"Processing page {i}/{len(pages_to_scrape)}: {page_number}")
 
             try:
-                tab = await self.playwright_manager.context.new_page()
+                tab = await browser_context.new_page()
                 self.logger.debug(f"Created new tab for page {page_number}")
 
                 page_url = f"{base_url}#/page/{page_number}"
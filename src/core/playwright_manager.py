@@ -1,7 +1,9 @@
+import json
 import logging
+from pathlib import Path
 import random
 
-from playwright.async_api import async_playwright
+from playwright.async_api import BrowserContext, async_playwright
 
 from src.utils.constants import PLAYWRIGHT_BROWSER_ARGS, PLAYWRIGHT_BROWSER_ARGS_DOCKER
 from src.utils.utils import is_running_in_docker
@@ -18,6 +20,7 @@ class PlaywrightManager:
         self.browser = None
         self.context = None
         self.page = None
+        self._context_options: dict = {}
 
     async def initialize(
         self,
@@ -42,12 +45,13 @@ class PlaywrightManager:
 
             self.browser = await self.playwright.chromium.launch(headless=headless, args=browser_args, proxy=proxy)
 
-            self.context = await self.browser.new_context(
-                locale=locale,
-                timezone_id=timezone_id,
-                user_agent=user_agent,
-                viewport={"width": random.randint(1366, 1920), "height": random.randint(768, 1080)},  # noqa: S311
-            )
+            self._context_options = {
+                "locale": locale,
+                "timezone_id": timezone_id,
+                "user_agent": user_agent,
+                "viewport": {"width": random.randint(1366, 1920), "height": random.randint(768, 1080)},  # noqa: S311
+            }
+            self.context = await self.browser.new_context(**self._context_options)
 
             self.page = await self.context.new_page()
             self.logger.info("Playwright initialized successfully.")
@@ -56,6 +60,84 @@ class PlaywrightManager:
             self.logger.error(f"Failed to initialize Playwright: {e!s}")
             raise
 
+    async def new_context(self) -> BrowserContext:
+        """
+        Open an additional browser context on the running browser.
+
+        The context shares the locale, timezone, user agent and viewport of the main context, so several
+        isolated workers can run on a single browser instance instead of launching one browser each.
+
+        Returns:
+            BrowserContext: The newly created context. The caller is responsible for closing it.
+        """
+        if self.browser is None:
+            raise RuntimeError("Playwright has not been initialized. Call `initialize()` first.")
+
+        return await self.browser.new_context(**self._context_options)
+
+    async def get_or_create_context(self, storage_state_path: str | Path | None = None) -> BrowserContext:
+        """
+        Return the shared browser context, creating it if needed.
+
+        When `storage_state_path` points to a state saved by `save_storage_state()`, its cookies are loaded
+        into the shared context and into every context opened afterwards with `new_context()`, so consent
+        banners and site preferences carry over between pages and runs.
+
+        Args:
+            storage_state_path (Optional[str | Path]): Path to a previously saved storage state.
+
+        Returns:
+            BrowserContext: The shared context.
+        """
+        if self.browser is None:
+            raise RuntimeError("Playwright has not been initialized. Call `initialize()` first.")
+
+        saved_state = self._load_storage_state(storage_state_path) if storage_state_path else None
+        if saved_state is not None:
+            # The parsed state is passed on rather than its path, so Playwright never re-reads the file
+            self._context_options["storage_state"] = saved_state
+
+        if self.context is None:
+            self.context = await self.browser.new_context(**self._context_options)
+        elif saved_state is not None:
+            try:
+                await self.context.add_cookies(saved_state.get("cookies", []))
+            except Exception as e:
+                self.logger.warning(f"Could not load storage state from {storage_state_path}: {e!s}")
+
+        return self.context
+
+    def _load_storage_state(self, storage_state_path: str | Path) -> dict | None:
+        """
+        Read and validate a state saved by `save_storage_state()`.
+
+        Returns:
+            Optional[dict]: The parsed state, or None when the file is missing or unreadable (e.g. truncated by a
+            run killed while saving it), in which case contexts start without a saved state.
+        """
+        state_file = Path(storage_state_path)
+        if not state_file.is_file():
+            return None
+        try:
+            saved_state = json.loads(state_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not load storage state from {state_file}: {e!s}")
+            return None
+        if not isinstance(saved_state, dict):
+            self.logger.warning(f"Could not load storage state from {state_file}: not a JSON object")
+            return None
+        return saved_state
+
+    async def save_storage_state(self, storage_state_path: str | Path):
+        """Persist the shared context's cookies and local storage so the next run can warm-start from them."""
+        if self.context is None:
+            return
+
+        state_file = Path(storage_state_path)
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        await self.context.storage_state(path=state_file)
+        self.logger.info(f"Saved browser storage state to {state_file}")
+
     async def cleanup(self):
         """Properly closes Playwright instances."""
         self.logger.info("Cleaning up Playwright resources...")
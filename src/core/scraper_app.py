@@ -103,12 +103,12 @@ async def run_scraper(
                     fmt_enum = SF.JSONL.value if storage_format == "jsonl" else SF.JSON.value
                     local_store.reset_json_file(file_path=file_path, storage_format=fmt_enum)
 
-                    def on_match_scraped_cb(record: dict):
+                    async def on_match_scraped_cb(record: dict):
+                        # Written from a worker thread so that disk I/O does not stall the other scraping tasks
                         try:
-                            if storage_format == "jsonl":
-                                local_store.append_jsonl_record(record=record, file_path=file_path, storage_format=SF.JSONL)
-                            else:
-                                local_store.append_json_record(record=record, file_path=file_path, storage_format=SF.JSON)
+                            await local_store.save_data_async(
+                                data=record, file_path=file_path, storage_format=fmt_enum, validate=False
+                            )
                         except Exception as write_err:
                             logger.error(f"Streaming write failed: {write_err}", exc_info=True)
             except Exception as stream_err:
@@ -1,18 +1,278 @@
-import csv
-import json
+from collections import OrderedDict
+from collections.abc import Callable
+import functools
 import logging
+import operator
 import os
+import queue
+import threading
+from typing import Any, BinaryIO, TextIO
+import weakref
 
 from .storage_format import StorageFormat
 
+# asyncio, concurrent.futures, csv, json and orjson are imported where they are first needed: a CLI run only
+# uses one storage format, and asyncio alone costs tens of milliseconds of startup for the synchronous callers.
+
+# O_BINARY only exists (and matters) on Windows, where descriptors default to newline translation
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+_VALID_FORMATS = frozenset(f.value for f in StorageFormat)
+_FORMAT_SUFFIXES = {fmt: f".{fmt}" for fmt in _VALID_FORMATS}
+
+# Writer methods for each format, looked up by name so that they resolve against the instance: one taking records,
+# one taking a batch already serialized by `_encode`
+_SAVE_METHOD_NAMES = {
+    StorageFormat.CSV.value: "_save_as_csv",
+    StorageFormat.JSON.value: "_save_as_json",
+    StorageFormat.JSONL.value: "_save_as_jsonl",
+}
+_WRITE_BATCH_METHOD_NAMES = {
+    StorageFormat.CSV.value: "_write_csv_batch",
+    StorageFormat.JSON.value: "_write_json_batch",
+    StorageFormat.JSONL.value: "_write_jsonl_batch",
+}
+
+
+@functools.cache
+def _import_orjson():
+    """Import orjson on first use, or return None when it is not installed."""
+    try:
+        import orjson
+    except ImportError:  # orjson is an optional speed-up, the stdlib encoder is used without it
+        return None
+    return orjson
+
+
+def _dumps(record: dict) -> bytes:
+    """Serialize a record to compact UTF-8 JSON, using orjson when it is installed."""
+    orjson = _import_orjson()
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson refuses (e.g. integers beyond 64 bits) still go through the stdlib encoder
+            pass
+    import json
+
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _dumps_indented(record: dict) -> bytes:
+    """Serialize a record with a 4-space indent, itself indented one level to sit inside a pretty-printed array."""
+    import json
+
+    return ("    " + json.dumps(record, ensure_ascii=False, indent=4).replace("\n", "\n    ")).encode("utf-8")
+
+
+# Cached per CSV path: (file handle, csv writer, fieldnames)
+_CsvHandle = tuple[TextIO, Any, tuple[str, ...]]
+
+# A batch serialized by `_encode`: (CSV columns, row tuples) for CSV, (None, encoded records) for JSON and JSONL
+_EncodedBatch = tuple[tuple[str, ...] | None, list]
+
+
+class _HandleLRU(OrderedDict):
+    """
+    Cache of open CSV handles bounded to `maxsize` entries.
+
+    Lookups through `get` mark an entry as recently used; adding an entry with `put` beyond `maxsize` drops the
+    least recently used handle, so a process writing to many files never runs out of file descriptors. Dropped
+    handles are not closed here, since another thread may still be writing to them: they wait in `evicted` until
+    their owner closes them under the lock of their file.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        self.evicted: list[tuple[str, TextIO]] = []
+
+    def get(self, key: str, default: _CsvHandle | None = None) -> _CsvHandle | None:
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def put(self, key: str, value: _CsvHandle):
+        self[key] = value
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            evicted_key, (file, *_) = self.popitem(last=False)
+            self.evicted.append((evicted_key, file))
+
+    def take_all(self) -> list[tuple[str, TextIO]]:
+        """Remove and return every cached and evicted handle, leaving the cache empty."""
+        handles = [(key, file) for key, (file, *_) in self.items()] + self.evicted
+        self.clear()
+        self.evicted = []
+        return handles
+
+    def close_all(self):
+        for _, file in self.take_all():
+            file.close()
+
+
+def _csv_row_getter(fieldnames: tuple[str, ...]) -> Callable[[dict], tuple]:
+    """Build a C-level extractor returning the values of `fieldnames` from a record as a tuple."""
+    if not fieldnames:
+        return lambda record: ()
+    if len(fieldnames) == 1:
+        # itemgetter with a single key returns the bare value rather than a 1-tuple
+        get_value = operator.itemgetter(fieldnames[0])
+        return lambda record: (get_value(record),)
+    return operator.itemgetter(*fieldnames)
+
+
+def _csv_rows_checked(data: list[dict], fieldnames: tuple[str, ...]) -> list[tuple]:
+    """
+    Build CSV rows the way `csv.DictWriter` does: missing columns become empty values and keys outside
+    `fieldnames` raise a `ValueError`.
+    """
+    known = set(fieldnames)
+    rows = []
+    for item in data:
+        extra = [key for key in item if key not in known]
+        if extra:
+            raise ValueError(f"dict contains fields not in fieldnames: {', '.join(map(repr, extra))}")
+        rows.append(tuple(item.get(name, "") for name in fieldnames))
+    return rows
+
+
+def _csv_rows(data: list[dict]) -> _EncodedBatch:
+    """Return the columns of a CSV batch, taken from its first record, and its rows as tuples."""
+    fieldnames = tuple(data[0].keys())
+    get_row = _csv_row_getter(fieldnames)
+    try:
+        rows = list(map(get_row, data))
+    except KeyError:
+        rows = None
+    # When every record has all the columns, a larger total key count can only mean extra keys
+    if rows is None or sum(map(len, data)) != len(fieldnames) * len(data):
+        rows = _csv_rows_checked(data, fieldnames)
+    return fieldnames, rows
+
+
+def _iov_max() -> int:
+    try:
+        limit = os.sysconf("SC_IOV_MAX")
+    except (AttributeError, ValueError, OSError):
+        limit = -1
+    # POSIX guarantees at least 16; 1024 is the usual Linux/BSD value when the limit cannot be queried
+    return limit if limit > 0 else 1024
+
+
+_IOV_MAX = _iov_max()
+
+
+def _write_all(fd: int, payload: bytes | memoryview):
+    view = memoryview(payload)
+    # os.write may write fewer bytes than requested (e.g. on signals or full pipes); keep going until done
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _group_writes(writes: list[tuple[list[dict], str, str]]) -> dict[str, tuple[str, list[list[dict]]]]:
+    """
+    Group prepared `(data, target_file_path, format)` writes by target file, keeping their order.
+
+    Consecutive batches for the same file are merged into one write, except CSV batches whose columns differ: a CSV
+    write takes its columns from the first record, so those start a new batch instead of losing values.
+    """
+    grouped: dict[str, tuple[str, list[list[dict]]]] = {}
+    for data, target_file_path, format_to_use in writes:
+        batches = grouped.setdefault(target_file_path, (format_to_use, []))[1]
+        if batches and (
+            format_to_use != StorageFormat.CSV.value
+            or not batches[-1]
+            or not data
+            or tuple(batches[-1][0]) == tuple(data[0])
+        ):
+            batches[-1].extend(data)
+        else:
+            batches.append(list(data))
+    return grouped
+
+
+def _group_encoded_writes(
+    writes: list[tuple[_EncodedBatch, str, str]],
+) -> dict[str, tuple[str, list[_EncodedBatch]]]:
+    """
+    Group serialized `(batch, target_file_path, format)` writes by target file, keeping their order.
+
+    Consecutive batches for the same file are merged as in `_group_writes`: always for JSON and JSONL, and for CSV
+    only while the columns stay the same.
+    """
+    grouped: dict[str, tuple[str, list[_EncodedBatch]]] = {}
+    for (columns, items), target_file_path, format_to_use in writes:
+        batches = grouped.setdefault(target_file_path, (format_to_use, []))[1]
+        if batches and batches[-1][0] == columns:
+            batches[-1][1].extend(items)
+        else:
+            batches.append((columns, items))
+    return grouped
+
+
+def _background_writer_loop(write_queue: queue.Queue):
+    """
+    Drain the write queue of a storage with background writes until a `None` sentinel arrives.
+
+    Each queued entry is `(write, batch, target_file_path, format)`, where `batch` was serialized by the saving
+    thread and `write` is the storage's callable appending it, so this thread only does file IO. It also means the
+    thread only references the storage while it has pending writes: once they are drained, an unreferenced storage
+    can be collected and its finalizer stops this loop. What is already queued for the same file is merged into one
+    write.
+    """
+    while True:
+        pending = [write_queue.get()]
+        while True:
+            try:
+                pending.append(write_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        count, stop = len(pending), None in pending
+        writes = [item for item in pending if item is not None]
+        pending = None
+        if writes:
+            write = writes[0][0]
+            grouped = _group_encoded_writes([item[1:] for item in writes])
+            for target_file_path, (format_to_use, batches) in grouped.items():
+                for batch in batches:
+                    write(batch, target_file_path, format_to_use)
+            # Drop every reference to the storage before waiting for more work
+            write = writes = None
+
+        for _ in range(count):
+            write_queue.task_done()
+        if stop:
+            return
+
+
+def _stop_writer(write_queue: queue.Queue, writer_thread: threading.Thread):
+    write_queue.put(None)
+    # The last reference to the storage can be dropped by the writer thread itself, which then exits on its own
+    if writer_thread is not threading.current_thread():
+        writer_thread.join()
+
 
 class LocalDataStorage:
     """
     A class to handle the storage of scraped data locally in either JSON or CSV format.
     """
 
+    WRITE_BUFFER_SIZE = 1 << 20
+    MAX_OPEN_FILES = 64
+    WRITE_QUEUE_SIZE = 256
+
     def __init__(
-        self, default_file_path: str = "scraped_data.csv", default_storage_format: StorageFormat = StorageFormat.CSV
+        self,
+        default_file_path: str = "scraped_data.csv",
+        default_storage_format: StorageFormat = StorageFormat.CSV,
+        buffer_size: int = WRITE_BUFFER_SIZE,
+        max_open_files: int = MAX_OPEN_FILES,
+        background_writes: bool = False,
+        pretty_json: bool = False,
     ):
         """
         Initialize LocalDataStorage.
@@ -20,10 +280,103 @@ class LocalDataStorage:
         Args:
             default_file_path (str): Default file path to use if none is provided in `save_data`.
             default_storage_format (StorageFormat): Default file format to use if none is provided in StorageFormat.CSV.
+            buffer_size (int): Write buffer size in bytes for the CSV files kept open between saves. A large buffer
+            turns a batch into a few big writes; every save still ends with a flush, so data is visible to readers
+            as soon as the call returns. JSON and JSONL batches are always written with a single write call.
+            Defaults to `WRITE_BUFFER_SIZE` (1 MiB).
+            max_open_files (int): Maximum number of CSV files kept open between saves; the least recently used one
+            is closed when the limit is exceeded and reopened on its next save. Defaults to `MAX_OPEN_FILES`.
+            background_writes (bool): Serialize data in the calling thread, then hand it to a writer thread through a
+            bounded queue, so that serialization overlaps with the file IO of earlier saves. Saves return once their
+            data is serialized, and queued saves to the same file are merged into one write. Call `flush` to wait
+            for pending writes and surface their errors. Defaults to False.
+            pretty_json (bool): Write JSON arrays with a 4-space indent, one record per line, for files meant to be
+            read by humans. The default compact form is smaller and faster to write and parse. Defaults to False.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.default_file_path = default_file_path
         self.default_storage_format = default_storage_format
+        self.buffer_size = buffer_size
+        self.pretty_json = pretty_json
+        # One lock per target file: writes from worker threads (`save_data_async`, `save_batch`) to the same file are
+        # serialized, while different files can be written in parallel
+        self._path_locks: dict[str, threading.Lock] = {}
+        # Directories already created or checked by this instance, so repeated saves skip the filesystem
+        self._dirs_ready: set[str] = set()
+        # Files written since the last `sync`; writes are otherwise left to the OS page cache
+        self._unsynced_paths: set[str] = set()
+        # CSV files stay open between calls, keyed by path. `_csv_lock` only guards lookups and evictions in this
+        # shared cache; rows are written under the file's own lock, so different CSV files are written in parallel.
+        self._csv_handles = _HandleLRU(max_open_files)
+        self._csv_lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, self._csv_handles.close_all)
+
+        self._write_queue: queue.Queue | None = None
+        self._writer_thread: threading.Thread | None = None
+        self._background_error: Exception | None = None
+        if background_writes:
+            self._write_queue = queue.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+            self._writer_thread = threading.Thread(
+                target=_background_writer_loop, args=(self._write_queue,), name="LocalDataStorageWriter", daemon=True
+            )
+            self._writer_thread.start()
+            # Registered after the CSV finalizer so that, at exit, queued writes are drained before files are closed
+            self._writer_finalizer = weakref.finalize(self, _stop_writer, self._write_queue, self._writer_thread)
+
+    def flush(self):
+        """
+        Wait for queued background writes, then flush every CSV file kept open by this instance.
+
+        Raises:
+            Exception: The first error raised by a background write since the previous flush.
+        """
+        self._wait_for_background_writes()
+        with self._csv_lock:
+            paths = list(self._csv_handles)
+        for path in paths:
+            with self._lock_for(path):
+                with self._csv_lock:
+                    cached = self._csv_handles.get(path)
+                if cached is not None:
+                    cached[0].flush()
+
+    def close(self):
+        """Finish queued background writes, then flush and close every CSV file kept open by this instance."""
+        if self._writer_thread is not None:
+            self._writer_finalizer()
+            self._write_queue = self._writer_thread = None
+        with self._csv_lock:
+            handles = self._csv_handles.take_all()
+        for path, file in handles:
+            with self._lock_for(path):
+                file.close()
+        self._raise_background_error()
+
+    def sync(self, file_path: str | None = None):
+        """
+        Force written data to stable storage with `os.fsync`.
+
+        Saves do not fsync, leaving durability to the OS writeback so that the scraping loop never waits on the
+        disk; call this at checkpoints where the data must survive a crash. Without `file_path`, every file written
+        since the last sync is synced.
+        """
+        self._wait_for_background_writes()
+        paths = [file_path] if file_path else list(self._unsynced_paths)
+        for path in paths:
+            with self._lock_for(path):
+                with self._csv_lock:
+                    cached = self._csv_handles.get(path)
+                if cached is not None:
+                    cached[0].flush()
+                    os.fsync(cached[0].fileno())
+                else:
+                    # fsync needs a writable descriptor on Windows
+                    fd = os.open(path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+                self._unsynced_paths.discard(path)
 
     def resolve_target_file_path(
         self, file_path: str | None, storage_format: StorageFormat | str | None
@@ -42,19 +395,23 @@ class LocalDataStorage:
         else:
             raise ValueError("Unsupported storage_format type provided.")
 
-        valid_formats = {f.value for f in StorageFormat}
-        if format_to_use not in valid_formats:
+        if format_to_use not in _VALID_FORMATS:
             raise ValueError(
-                f"Invalid storage format. Supported formats are: {', '.join(sorted(valid_formats))}."
+                f"Invalid storage format. Supported formats are: {', '.join(sorted(_VALID_FORMATS))}."
             )
 
-        if not target_file_path.endswith(f".{format_to_use}"):
-            target_file_path = f"{target_file_path}.{format_to_use}"
+        suffix = _FORMAT_SUFFIXES[format_to_use]
+        if not target_file_path.endswith(suffix):
+            target_file_path += suffix
 
         return target_file_path, format_to_use
 
     def save_data(
-        self, data: dict | list[dict], file_path: str | None = None, storage_format: StorageFormat | str | None = None
+        self,
+        data: dict | list[dict],
+        file_path: str | None = None,
+        storage_format: StorageFormat | str | None = None,
+        validate: bool = True,
     ):
         """
         Save scraped data to a local CSV file.
@@ -64,31 +421,160 @@ class LocalDataStorage:
             file_path (str, optional): The file path to save the data. Defaults to `self.default_file_path`.
             storage_format (StorageFormat, optional): The format to save the data in ("csv" or "json").
             Defaults to `self.default_storage_format`.
+            validate (bool, optional): Check that `data` is a list of dictionaries. Only the first item is inspected,
+            since batches are homogeneous; pass False for trusted data to skip the check. Defaults to True.
 
         Raises:
             ValueError: If the data is not in the correct format (dict or list of dicts).
             Exception: If an error occurs during file operations.
         """
+        data, target_file_path, format_to_use = self._prepare_write(data, file_path, storage_format, validate)
+        self._submit(data, target_file_path, format_to_use)
+
+    def save_batch(
+        self,
+        writes: list[tuple[str | None, dict | list[dict], StorageFormat | str | None]],
+        max_workers: int | None = None,
+    ):
+        """
+        Save several batches of data, writing the distinct target files in parallel.
+
+        All entries are validated and resolved before anything is written. Entries that target the same file are
+        merged, in order, into a single write (CSV entries only when their columns match); the distinct files are
+        then written concurrently by a thread pool.
+
+        Args:
+            writes (List[Tuple]): `(file_path, data, storage_format)` entries, with the same meaning as the
+            arguments of `save_data`.
+            max_workers (int, optional): Maximum number of files written at the same time. Defaults to the
+            `ThreadPoolExecutor` default.
+
+        Raises:
+            ValueError: If any entry has invalid data or an unsupported storage format.
+            Exception: The first error raised while writing a file, after all files have been attempted.
+        """
+        grouped = _group_writes(
+            [self._prepare_write(data, file_path, storage_format, True) for file_path, data, storage_format in writes]
+        )
+
+        if self._write_queue is not None or len(grouped) <= 1:
+            for target_file_path, (format_to_use, batches) in grouped.items():
+                for records in batches:
+                    self._submit(records, target_file_path, format_to_use)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._write_batches, batches, target_file_path, format_to_use)
+                for target_file_path, (format_to_use, batches) in grouped.items()
+            ]
+        for future in futures:
+            future.result()
+
+    def _write_batches(self, batches: list[list[dict]], target_file_path: str, format_to_use: str):
+        """Write the grouped batches of one file in order."""
+        for records in batches:
+            self._write(records, target_file_path, format_to_use)
+
+    def _prepare_write(
+        self, data: dict | list[dict], file_path: str | None, storage_format: StorageFormat | str | None, validate: bool
+    ) -> tuple[list[dict], str, str]:
+        """Normalize and validate `data` and resolve its target file path and format."""
         if isinstance(data, dict):
             data = [data]
 
-        if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+        if validate and (not isinstance(data, list) or (data and not isinstance(data[0], dict))):
             raise ValueError("Data must be a dictionary or a list of dictionaries.")
 
         target_file_path, format_to_use = self.resolve_target_file_path(
             file_path=file_path, storage_format=storage_format
         )
 
-        self._ensure_directory_exists(target_file_path)
+        if format_to_use not in _SAVE_METHOD_NAMES:
+            raise ValueError("Unsupported file format.")
 
-        if format_to_use == StorageFormat.CSV.value:
-            self._save_as_csv(data, target_file_path)
-        elif format_to_use == StorageFormat.JSON.value:
-            self._save_as_json(data, target_file_path)
-        elif format_to_use == StorageFormat.JSONL.value:
-            self._save_as_jsonl(data, target_file_path)
+        return data, target_file_path, format_to_use
+
+    def _submit(self, data: list[dict], target_file_path: str, format_to_use: str):
+        """Write prepared data now, or serialize it and queue it for the writer thread when background writes are on."""
+        if self._write_queue is None:
+            self._write(data, target_file_path, format_to_use)
         else:
-            raise ValueError("Unsupported file format.")
+            # Serialized here, so the queued bytes and row tuples no longer depend on the caller's records. Blocks while
+            # the queue is full, so a slow disk applies back-pressure instead of growing memory.
+            batch = self._encode(data, format_to_use)
+            self._write_queue.put((self._write_queued, batch, target_file_path, format_to_use))
+
+    def _encode(self, data: list[dict], format_to_use: str) -> _EncodedBatch:
+        """Serialize records into the batch appended by the `_write_*_batch` method of `format_to_use`."""
+        if format_to_use == StorageFormat.CSV.value:
+            return _csv_rows(data)
+        if format_to_use == StorageFormat.JSON.value and self.pretty_json:
+            return None, list(map(_dumps_indented, data))
+        return None, list(map(_dumps, data))
+
+    def _write_queued(self, batch: _EncodedBatch, target_file_path: str, format_to_use: str):
+        """Append a batch taken from the background queue, keeping any error for the next `flush`."""
+        try:
+            self._write_locked(target_file_path, getattr(self, _WRITE_BATCH_METHOD_NAMES[format_to_use]), batch)
+        except Exception as e:
+            # Already logged by the writer; kept so that the next `flush` reports it to the caller
+            if self._background_error is None:
+                self._background_error = e
+
+    def _wait_for_background_writes(self):
+        if self._write_queue is not None:
+            self._write_queue.join()
+        self._raise_background_error()
+
+    def _raise_background_error(self):
+        error, self._background_error = self._background_error, None
+        if error is not None:
+            raise error
+
+    def _write(self, data: list[dict], target_file_path: str, format_to_use: str):
+        """Write prepared data to `target_file_path` while holding the lock of that file."""
+        self._write_locked(target_file_path, getattr(self, _SAVE_METHOD_NAMES[format_to_use]), data)
+
+    def _write_locked(self, target_file_path: str, write: Callable[[Any, str], None], payload: Any):
+        """Call `write(payload, target_file_path)` while holding the lock of that file."""
+        with self._lock_for(target_file_path):
+            self._ensure_directory_exists(target_file_path)
+            write(payload, target_file_path)
+            self._unsynced_paths.add(target_file_path)
+        # Only once this file's lock is released, so that waiting on another file's lock cannot deadlock
+        self._close_evicted_csv_handles()
+
+    def _close_evicted_csv_handles(self):
+        """Close CSV handles dropped from the cache, each under the lock of its file so no write is cut short."""
+        with self._csv_lock:
+            evicted, self._csv_handles.evicted = self._csv_handles.evicted, []
+        for path, file in evicted:
+            with self._lock_for(path):
+                file.close()
+
+    def _lock_for(self, file_path: str) -> threading.Lock:
+        # dict.setdefault is atomic, so concurrent first writes to a path still end up sharing one lock
+        return self._path_locks.get(file_path) or self._path_locks.setdefault(file_path, threading.Lock())
+
+    async def save_data_async(
+        self,
+        data: dict | list[dict],
+        file_path: str | None = None,
+        storage_format: StorageFormat | str | None = None,
+        validate: bool = True,
+    ):
+        """
+        Save scraped data like `save_data`, running the file write in a worker thread.
+
+        The event loop keeps scraping while the data is written; concurrent calls are serialized so that records
+        from different calls never interleave within a file.
+        """
+        import asyncio
+
+        await asyncio.to_thread(self.save_data, data, file_path, storage_format, validate)
 
     def append_json_record(
         self, record: dict, file_path: str | None = None, storage_format: StorageFormat | str | None = None
@@ -104,8 +590,7 @@ class LocalDataStorage:
         if format_to_use != StorageFormat.JSON.value:
             raise ValueError("append_json_record is only supported for JSON format.")
 
-        self._ensure_directory_exists(target_file_path)
-        self._save_as_json([record], target_file_path)
+        self._submit([record], target_file_path, format_to_use)
 
     def reset_json_file(
         self, file_path: str | None = None, storage_format: StorageFormat | str | None = None
@@ -116,48 +601,113 @@ class LocalDataStorage:
         )
 
         if format_to_use == StorageFormat.JSON.value:
-            self._ensure_directory_exists(target_file_path)
-            with open(target_file_path, "w", encoding="utf-8") as file:
-                json.dump([], file, indent=4)
+            empty_content = b"[]"
         elif format_to_use == StorageFormat.JSONL.value:
             # Truncate to empty file for JSONL
-            self._ensure_directory_exists(target_file_path)
-            with open(target_file_path, "w", encoding="utf-8") as file:
-                file.write("")
+            empty_content = b""
         else:
             raise ValueError("reset_json_file is only supported for JSON/JSONL format.")
 
+        # Records queued before the reset must not land in the fresh file
+        self._wait_for_background_writes()
+        with self._lock_for(target_file_path):
+            self._ensure_directory_exists(target_file_path)
+            self._replace_file_contents(target_file_path, empty_content)
+            self._unsynced_paths.add(target_file_path)
+
         return target_file_path
 
     def _save_as_csv(self, data: list[dict], file_path: str):
-        """Save data in CSV format."""
-        try:
-            with open(file_path, mode="a", newline="", encoding="utf-8") as file:
-                writer = csv.DictWriter(file, fieldnames=data[0].keys())
+        """Save data in CSV format, reusing the file handle and writer kept open for `file_path`."""
+        self._write_csv_batch(self._encode(data, StorageFormat.CSV.value), file_path)
 
-                # Write header only if the file is newly created
-                if os.path.getsize(file_path) == 0:
-                    writer.writeheader()
-
-                writer.writerows(data)
+    def _write_csv_batch(self, batch: _EncodedBatch, file_path: str):
+        """Append the row tuples of a serialized CSV batch, writing the header first when the file is new."""
+        fieldnames, rows = batch
+        try:
+            file, writer = self._get_csv_writer(file_path, fieldnames)
+            writer.writerows(rows)
+            file.flush()
 
-            self.logger.info(f"Successfully saved {len(data)} record(s) to {file_path}")
+            self.logger.info(f"Successfully saved {len(rows)} record(s) to {file_path}")
 
         except Exception as e:
             self.logger.error(f"Error saving data to {file_path}: {e!s}", exc_info=True)
             raise
 
+    def _get_csv_writer(self, file_path: str, fieldnames: tuple[str, ...]) -> tuple[TextIO, Any]:
+        """
+        Return the cached handle and writer for `file_path`, opening the file on first use.
+
+        Rows are written with a plain `csv.writer` from tuples built by `operator.itemgetter`, which avoids the
+        per-row dictionary handling of `csv.DictWriter`. A cached entry whose fieldnames differ from `fieldnames`
+        is closed and replaced, so that rows are always written with the columns of the current batch.
+        """
+        # The caller holds the lock of `file_path`, so only the shared cache itself needs `_csv_lock`
+        with self._csv_lock:
+            cached = self._csv_handles.get(file_path)
+            if cached is not None and cached[2] != fieldnames:
+                del self._csv_handles[file_path]
+        if cached is not None:
+            file, writer, cached_fieldnames = cached
+            if cached_fieldnames == fieldnames:
+                return file, writer
+            file.close()
+
+        import csv
+
+        file = open(file_path, mode="a", newline="", encoding="utf-8", buffering=self.buffer_size)  # noqa: SIM115
+        try:
+            writer = csv.writer(file)
+
+            # Write header only if the file is newly created (append mode starts at the end of the file)
+            if file.tell() == 0:
+                writer.writerow(fieldnames)
+        except Exception:
+            file.close()
+            raise
+
+        with self._csv_lock:
+            self._csv_handles.put(file_path, (file, writer, fieldnames))
+        return file, writer
+
     def _save_as_jsonl(self, data: list[dict], file_path: str):
         """Save data in JSON Lines format (one JSON per line)."""
+        self._write_jsonl_batch(self._encode(data, StorageFormat.JSONL.value), file_path)
+
+    def _write_jsonl_batch(self, batch: _EncodedBatch, file_path: str):
+        """Append the encoded records of a serialized JSONL batch, one per line."""
+        lines = batch[1]
         try:
-            with open(file_path, "a", encoding="utf-8") as file:
-                for item in data:
-                    file.write(json.dumps(item, ensure_ascii=False) + "\n")
-            self.logger.info(f"Successfully appended {len(data)} JSONL line(s) to {file_path}")
+            # The encoded records and their newlines are handed to the kernel as a gather list, so the batch is
+            # written without first being copied into one contiguous buffer
+            self._append_buffers(file_path, [part for line in lines for part in (line, b"\n")])
+            self.logger.info(f"Successfully appended {len(lines)} JSONL line(s) to {file_path}")
         except Exception as e:
             self.logger.error(f"Error appending JSONL to {file_path}: {e!s}", exc_info=True)
             raise
 
+    @staticmethod
+    def _append_buffers(file_path: str, buffers: list[bytes]):
+        """
+        Append `buffers` through a raw O_APPEND descriptor with `os.writev`, in chunks of at most IOV_MAX buffers.
+
+        Platforms without `os.writev` get a single write of the joined buffers instead.
+        """
+        fd = os.open(file_path, _APPEND_FLAGS, 0o644)
+        try:
+            if not hasattr(os, "writev"):
+                _write_all(fd, b"".join(buffers))
+                return
+            for start in range(0, len(buffers), _IOV_MAX):
+                chunk = buffers[start : start + _IOV_MAX]
+                written = os.writev(fd, chunk)
+                if written < sum(map(len, chunk)):
+                    # Short gather write: finish the rest of this chunk with plain writes
+                    _write_all(fd, memoryview(b"".join(chunk))[written:])
+        finally:
+            os.close(fd)
+
     def append_jsonl_record(
         self, record: dict, file_path: str | None = None, storage_format: StorageFormat | str | None = None
     ):
@@ -169,35 +719,146 @@ class LocalDataStorage:
         )
         if format_to_use != StorageFormat.JSONL.value:
             raise ValueError("append_jsonl_record is only supported for JSONL format.")
-        self._ensure_directory_exists(target_file_path)
-        self._save_as_jsonl([record], target_file_path)
+        self._submit([record], target_file_path, format_to_use)
 
     def _save_as_json(self, data: list[dict], file_path: str):
-        """Save data in JSON format."""
+        """Save data in JSON format, appending to the array already stored in the file."""
+        self._write_json_batch(self._encode(data, StorageFormat.JSON.value), file_path)
+
+    def _write_json_batch(self, batch: _EncodedBatch, file_path: str):
+        """Append the encoded records of a serialized JSON batch to the array stored in the file."""
+        records = batch[1]
         try:
-            # Load existing data if the file already exists
-            existing_data = []
+            self._append_to_json_array(file_path, records)
+            self.logger.info(f"Successfully saved {len(records)} record(s) to {file_path}")
 
-            if os.path.exists(file_path):
-                with open(file_path, encoding="utf-8") as file:
-                    try:
-                        existing_data = json.load(file)
-                    except json.JSONDecodeError:
-                        self.logger.warning(f"File {file_path} exists but is empty or invalid JSON.")
+        except Exception as e:
+            self.logger.error(f"Error saving data to {file_path}: {e!s}", exc_info=True)
+            raise
 
-            combined_data = existing_data + data
+    def _append_to_json_array(self, file_path: str, records: list[bytes]):
+        """
+        Append records encoded by `_encode` to the JSON array in `file_path`, reading existing content only if needed.
+
+        The closing bracket is located by scanning back from the end of the file, the file is truncated there
+        and the new records are written followed by a new closing bracket, so each append costs time proportional
+        to the new records only. A missing file is created as a new array. When the ends of the file do not look like
+        an array of records (e.g. an array of scalars, or an append interrupted before its closing bracket), the file
+        is parsed once to decide: arrays are appended to in place, other JSON values raise a `ValueError`, and
+        only an empty or unparsable file is replaced atomically by an array holding the new records.
+        """
+        if self.pretty_json:
+            # Same layout as json.dump(..., indent=4): one indented record per line, closing bracket on its own line
+            first_separator, separator, closing = b"\n", b",\n", b"\n]"
+        else:
+            first_separator, separator, closing = b"", b",", b"]"
+        payload = separator.join(records)
+        new_array = b"[" + first_separator + payload + closing if payload else b"[]"
 
-            with open(file_path, "w", encoding="utf-8") as file:
-                json.dump(combined_data, file, indent=4)
+        try:
+            file = open(file_path, "r+b")  # noqa: SIM115
+        except FileNotFoundError:
+            with open(file_path, "wb") as new_file:
+                new_file.write(new_array)
+            return
+
+        with file:
+            end = file.seek(0, os.SEEK_END)
+            last = self._find_last_non_whitespace(file, end)
+            before_last = self._find_last_non_whitespace(file, last[0]) if last and last[1] == b"]" else None
+
+            # The common case, an array of records, is recognised from the ends of the file alone
+            if before_last is not None and before_last[1] in (b"[", b"}", b"]") and self._starts_with_bracket(file):
+                array_end = (before_last[0] + 1, before_last[1] == b"[")
+            else:
+                array_end = self._parse_array_end(file, file_path, last, before_last)
+
+            if array_end is not None:
+                if not payload:
+                    return
+                # Cut right after the last element (or the opening bracket), dropping the old closing bracket
+                cut, is_empty = array_end
+                file.seek(cut)
+                file.truncate()
+                file.write((first_separator if is_empty else separator) + payload + closing)
+                return
+
+        if end:
+            self.logger.warning(f"File {file_path} exists but is not a valid JSON array; overwriting it.")
+        self._replace_file_contents(file_path, new_array)
+
+    @staticmethod
+    def _parse_array_end(
+        file: BinaryIO, file_path: str, last: tuple[int, bytes] | None, before_last: tuple[int, bytes] | None
+    ) -> tuple[int, bool] | None:
+        """
+        Parse the whole file to find where new elements go, for files the end-of-file check could not vouch for.
 
-            self.logger.info(f"Successfully saved {len(data)} record(s) to {file_path}")
+        Returns the offset right after the last element (or the opening bracket) and whether the array is empty, or
+        None when the file is empty or not JSON. An array missing only its closing bracket, as left by an append
+        interrupted after the truncation, is recovered rather than discarded. Raises `ValueError` for valid JSON
+        that is not an array, which must not be overwritten.
+        """
+        if last is None:
+            return None
+        import json
 
-        except Exception as e:
-            self.logger.error(f"Error saving data to {file_path}: {e!s}", exc_info=True)
+        file.seek(0)
+        content = file.read()
+        try:
+            existing = json.loads(content)
+        except ValueError:  # JSONDecodeError, or UnicodeDecodeError for bytes that are not UTF-8
+            try:
+                existing = json.loads(content + b"]")
+            except ValueError:
+                return None
+            if isinstance(existing, list):
+                return last[0] + 1, not existing
+        else:
+            if isinstance(existing, list):
+                # A parsed array ends with its closing bracket, so `before_last` is the last element or the "["
+                return before_last[0] + 1, not existing
+        raise ValueError(f"File {file_path} holds JSON data that is not an array; refusing to overwrite it.")
+
+    @staticmethod
+    def _replace_file_contents(file_path: str, content: bytes):
+        """Write `content` to a temporary sibling file and atomically move it over `file_path`."""
+        tmp_path = f"{file_path}.tmp"
+        try:
+            with open(tmp_path, "wb") as tmp_file:
+                tmp_file.write(content)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             raise
 
+    @staticmethod
+    def _starts_with_bracket(file: BinaryIO, chunk_size: int = 64) -> bool:
+        """Tell whether the first non-whitespace byte of `file` is an opening bracket."""
+        file.seek(0)
+        while chunk := file.read(chunk_size):
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped[:1] == b"["
+        return False
+
+    @staticmethod
+    def _find_last_non_whitespace(file: BinaryIO, end: int, chunk_size: int = 64) -> tuple[int, bytes] | None:
+        """Return the offset and value of the last non-whitespace byte before `end`, reading back in small chunks."""
+        pos = end
+        while pos > 0:
+            start = max(0, pos - chunk_size)
+            file.seek(start)
+            stripped = file.read(pos - start).rstrip()
+            if stripped:
+                return start + len(stripped) - 1, stripped[-1:]
+            pos = start
+        return None
+
     def _ensure_directory_exists(self, file_path: str):
         """Ensures the directory for the given file path exists. If it doesn't exist, creates it."""
         directory = os.path.dirname(file_path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
+        if directory and directory not in self._dirs_ready:
+            os.makedirs(directory, exist_ok=True)
+            self._dirs_ready.add(directory)
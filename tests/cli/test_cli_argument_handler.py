@@ -139,3 +139,36 @@ def test_parse_and_validate_args_invalid_args(cli_handler):
         cli_handler.parse_and_validate_args()
 
         mock_exit.assert_called_once_with(1)
+
+
+def test_load_match_links_from_csv_uses_match_link_column(cli_handler, tmp_path):
+    csv_path = tmp_path / "links.csv"
+    csv_path.write_text(
+        "league,Match_Link\npl,https://oddsportal.com/match1\npl, \npl,https://oddsportal.com/match2\n",
+        encoding="utf-8",
+    )
+
+    assert cli_handler._load_match_links_from_csv(csv_path) == [
+        "https://oddsportal.com/match1",
+        "https://oddsportal.com/match2",
+    ]
+
+
+def test_load_match_links_from_csv_falls_back_to_first_column(cli_handler, tmp_path):
+    csv_path = tmp_path / "links.csv"
+    csv_path.write_text(
+        "url,note\nhttps://oddsportal.com/match1,a\n\nhttps://oddsportal.com/match2,b\n",
+        encoding="utf-8",
+    )
+
+    assert cli_handler._load_match_links_from_csv(csv_path) == [
+        "https://oddsportal.com/match1",
+        "https://oddsportal.com/match2",
+    ]
+
+
+def test_load_match_links_from_empty_csv(cli_handler, tmp_path):
+    csv_path = tmp_path / "links.csv"
+    csv_path.write_text("", encoding="utf-8")
+
+    assert cli_handler._load_match_links_from_csv(csv_path) == []
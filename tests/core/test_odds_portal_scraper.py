@@ -328,6 +328,31 @@ async def test_collect_match_links(setup_scraper_mocks):
     )
 
 
+@pytest.mark.asyncio
+async def test_collect_match_links_uses_given_context(setup_scraper_mocks):
+    """Test that tabs are opened in the provided context instead of the manager's one."""
+    mocks = setup_scraper_mocks
+    scraper = mocks["scraper"]
+    default_context_mock = mocks["context_mock"]
+
+    tab_mock = AsyncMock(spec=Page)
+    worker_context_mock = AsyncMock(spec=BrowserContext)
+    worker_context_mock.new_page.return_value = tab_mock
+
+    scraper.extract_match_links = AsyncMock(return_value=["https://oddsportal.com/match1"])
+    scraper._save_collected_links = MagicMock()
+
+    result = await scraper._collect_match_links(
+        base_url="https://oddsportal.com/football/england/premier-league-2023",
+        pages_to_scrape=[1],
+        context=worker_context_mock,
+    )
+
+    worker_context_mock.new_page.assert_called_once()
+    default_context_mock.new_page.assert_not_called()
+    assert result == ["https://oddsportal.com/match1"]
+
+
 @pytest.mark.asyncio
 async def test_collect_match_links_error_handling(setup_scraper_mocks):
     """Test error handling in collect_match_links method."""
@@ -0,0 +1,75 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.playwright_manager import PlaywrightManager
+
+SAVED_STATE = {
+    "cookies": [{"name": "consent", "value": "1", "domain": ".oddsportal.com", "path": "/"}],
+    "origins": [],
+}
+
+
+@pytest.fixture
+def playwright_manager():
+    manager = PlaywrightManager()
+    manager.browser = MagicMock()
+    manager.browser.new_context = AsyncMock(side_effect=lambda **options: AsyncMock())
+    manager._context_options = {"locale": "en-GB", "timezone_id": None, "user_agent": None}
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_context_loads_valid_storage_state(playwright_manager, tmp_path):
+    state_file = tmp_path / ".storage_state.json"
+    state_file.write_text(json.dumps(SAVED_STATE), encoding="utf-8")
+
+    await playwright_manager.get_or_create_context(storage_state_path=state_file)
+    await playwright_manager.new_context()
+
+    for call in playwright_manager.browser.new_context.call_args_list:
+        assert call.kwargs["storage_state"] == SAVED_STATE
+        assert call.kwargs["locale"] == "en-GB"
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_context_adds_cookies_to_existing_context(playwright_manager, tmp_path):
+    state_file = tmp_path / ".storage_state.json"
+    state_file.write_text(json.dumps(SAVED_STATE), encoding="utf-8")
+    playwright_manager.context = AsyncMock()
+
+    context = await playwright_manager.get_or_create_context(storage_state_path=state_file)
+
+    assert context is playwright_manager.context
+    context.add_cookies.assert_awaited_once_with(SAVED_STATE["cookies"])
+    playwright_manager.browser.new_context.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content", ['{"cookies": [{"name": "consent"', "", "[]"])
+async def test_get_or_create_context_ignores_corrupt_storage_state(playwright_manager, tmp_path, caplog, content):
+    state_file = tmp_path / ".storage_state.json"
+    state_file.write_text(content, encoding="utf-8")
+
+    await playwright_manager.get_or_create_context(storage_state_path=state_file)
+    await playwright_manager.new_context()
+
+    assert playwright_manager.browser.new_context.await_count == 2
+    for call in playwright_manager.browser.new_context.call_args_list:
+        assert "storage_state" not in call.kwargs
+    assert len([record for record in caplog.records if "Could not load storage state" in record.message]) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_context_without_saved_state(playwright_manager, tmp_path, caplog):
+    await playwright_manager.get_or_create_context(storage_state_path=tmp_path / "missing.json")
+
+    assert "storage_state" not in playwright_manager.browser.new_context.call_args.kwargs
+    assert not caplog.records
+
+
+@pytest.mark.asyncio
+async def test_new_context_requires_initialized_browser():
+    with pytest.raises(RuntimeError, match="has not been initialized"):
+        await PlaywrightManager().new_context()
@@ -1,10 +1,13 @@
+import asyncio
 import csv
+import gc
 import json
-from unittest.mock import mock_open, patch
+import os
+from unittest.mock import patch
 
 import pytest
 
-from src.storage.local_data_storage import LocalDataStorage
+from src.storage.local_data_storage import LocalDataStorage, _dumps, _group_writes, _write_all
 from src.storage.storage_format import StorageFormat
 
 
@@ -21,6 +24,17 @@ def sample_data():
 def test_initialization(local_data_storage):
     assert local_data_storage.default_file_path == "test_data"
     assert local_data_storage.default_storage_format == StorageFormat.CSV
+    assert local_data_storage.buffer_size == LocalDataStorage.WRITE_BUFFER_SIZE
+
+
+def test_custom_buffer_size(sample_data, tmp_path):
+    storage = LocalDataStorage(buffer_size=64 * 1024)
+    file_path = str(tmp_path / "test_data.csv")
+
+    with patch("builtins.open", wraps=open) as mock_file:
+        storage._save_as_csv(sample_data, file_path)
+
+    mock_file.assert_called_once_with(file_path, mode="a", newline="", encoding="utf-8", buffering=64 * 1024)
 
 
 def test_save_data_invalid_format(local_data_storage):
@@ -28,6 +42,18 @@ def test_save_data_invalid_format(local_data_storage):
         local_data_storage.save_data("invalid_data")
 
 
+def test_save_data_invalid_items(local_data_storage):
+    with pytest.raises(ValueError, match="Data must be a dictionary or a list of dictionaries."):
+        local_data_storage.save_data(["invalid_item"])
+
+
+def test_save_data_without_validation(local_data_storage, sample_data):
+    with patch.object(local_data_storage, "_save_as_csv") as mock_save:
+        local_data_storage.save_data(sample_data, file_path="test.csv", storage_format="csv", validate=False)
+
+    mock_save.assert_called_once_with(sample_data, "test.csv")
+
+
 def test_save_data_dict_conversion(local_data_storage):
     data = {"team": "Team A", "odds": 2.5}
 
@@ -63,73 +89,163 @@ def test_save_data_unsupported_format(local_data_storage, sample_data):
         local_data_storage.save_data(sample_data, storage_format="unsupported")
 
 
-def test_save_as_csv(local_data_storage, sample_data):
-    mock_file = mock_open()
+def test_save_as_csv(local_data_storage, sample_data, tmp_path):
+    file_path = tmp_path / "test_data.csv"
+
+    local_data_storage._save_as_csv(sample_data, str(file_path))
+
+    with open(file_path, newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert rows == [{"team": "Team A", "odds": "2.5"}, {"team": "Team B", "odds": "1.8"}]
 
-    with patch("builtins.open", mock_file), patch("os.path.getsize", return_value=0):
-        local_data_storage._save_as_csv(sample_data, "test_data.csv")
 
-    # Check if file was opened correctly
-    mock_file.assert_called_once_with("test_data.csv", mode="a", newline="", encoding="utf-8")
+def test_save_as_csv_existing_file(local_data_storage, sample_data, tmp_path):
+    file_path = tmp_path / "test_data.csv"
+    file_path.write_text("team,odds\r\nOld Team,3.0\r\n", encoding="utf-8")
 
-    # Validate the written content
-    handle = mock_file()
-    writer = csv.DictWriter(handle, fieldnames=sample_data[0].keys())
-    writer.writeheader()
-    writer.writerows(sample_data)
-    handle.write.assert_called()
+    local_data_storage._save_as_csv(sample_data, str(file_path))
 
+    # Header should not be written again for an existing file
+    lines = file_path.read_text(encoding="utf-8").splitlines()
+    assert lines == ["team,odds", "Old Team,3.0", "Team A,2.5", "Team B,1.8"]
 
-def test_save_as_csv_existing_file(local_data_storage, sample_data):
-    mock_file = mock_open()
 
-    with patch("builtins.open", mock_file), patch("os.path.getsize", return_value=100):
-        local_data_storage._save_as_csv(sample_data, "test_data.csv")
+def test_save_as_csv_reuses_open_file(local_data_storage, sample_data, tmp_path):
+    file_path = tmp_path / "test_data.csv"
 
-    # Check if file was opened correctly
-    mock_file.assert_called_once_with("test_data.csv", mode="a", newline="", encoding="utf-8")
+    with patch("builtins.open", wraps=open) as mock_file:
+        local_data_storage._save_as_csv(sample_data[:1], str(file_path))
+        local_data_storage._save_as_csv(sample_data[1:], str(file_path))
 
+    mock_file.assert_called_once_with(
+        str(file_path), mode="a", newline="", encoding="utf-8", buffering=LocalDataStorage.WRITE_BUFFER_SIZE
+    )
+    # Each call is flushed, so the rows are readable before the storage is closed
+    assert file_path.read_text(encoding="utf-8").splitlines() == ["team,odds", "Team A,2.5", "Team B,1.8"]
 
-def test_save_as_json(local_data_storage, sample_data):
-    mock_file = mock_open()
 
-    with patch("builtins.open", mock_file), patch("os.path.exists", return_value=False):
-        local_data_storage._save_as_json(sample_data, "test_data.json")
+def test_save_as_csv_reopens_when_fieldnames_change(local_data_storage, sample_data, tmp_path):
+    file_path = tmp_path / "test_data.csv"
 
-    # Check if file was opened in write mode
-    mock_file.assert_called_once_with("test_data.json", "w", encoding="utf-8")
+    local_data_storage._save_as_csv(sample_data, str(file_path))
+    first_handle = local_data_storage._csv_handles[str(file_path)][0]
+    local_data_storage._save_as_csv([{"odds": 4.0, "team": "Team C"}], str(file_path))
 
-    # Validate JSON content
-    handle = mock_file()
-    json.dump(sample_data, handle, indent=4)
-    handle.write.assert_called()
+    assert first_handle.closed
+    assert file_path.read_text(encoding="utf-8").splitlines()[-1] == "4.0,Team C"
 
 
-def test_save_as_json_existing_data(local_data_storage, sample_data):
+def test_close_closes_csv_files(local_data_storage, sample_data, tmp_path):
+    local_data_storage._save_as_csv(sample_data, str(tmp_path / "test_data.csv"))
+    handle = local_data_storage._csv_handles[str(tmp_path / "test_data.csv")][0]
+
+    local_data_storage.close()
+
+    assert handle.closed
+    assert local_data_storage._csv_handles == {}
+
+
+def test_save_as_json(local_data_storage, sample_data, tmp_path):
+    file_path = tmp_path / "test_data.json"
+
+    local_data_storage._save_as_json(sample_data, str(file_path))
+
+    assert json.loads(file_path.read_text(encoding="utf-8")) == sample_data
+
+
+def test_save_as_json_existing_data(local_data_storage, sample_data, tmp_path):
     existing_data = [{"team": "Old Team", "odds": 3.0}]
-    expected_combined_data = existing_data + sample_data
+    file_path = tmp_path / "test_data.json"
+    file_path.write_text(json.dumps(existing_data, indent=4) + "\n", encoding="utf-8")
+
+    local_data_storage._save_as_json(sample_data, str(file_path))
+
+    assert json.loads(file_path.read_text(encoding="utf-8")) == existing_data + sample_data
+
+
+def test_save_as_json_empty_array(local_data_storage, sample_data, tmp_path):
+    file_path = tmp_path / "test_data.json"
+    file_path.write_text("[]", encoding="utf-8")
+
+    local_data_storage._save_as_json(sample_data[:1], str(file_path))
+    local_data_storage._save_as_json(sample_data[1:], str(file_path))
 
-    mock_file = mock_open(read_data=json.dumps(existing_data))
+    assert json.loads(file_path.read_text(encoding="utf-8")) == sample_data
 
-    with patch("builtins.open", mock_file), patch("os.path.exists", return_value=True):
-        local_data_storage._save_as_json(sample_data, "test_data.json")
 
-    # Validate the final content of the JSON file
-    handle = mock_file()
-    json.dump(expected_combined_data, handle, indent=4)
-    handle.write.assert_called()
+def test_save_as_json_does_not_read_existing_content(local_data_storage, sample_data, tmp_path):
+    file_path = tmp_path / "test_data.json"
+    file_path.write_text(json.dumps([{"team": "Old Team", "odds": 3.0}] * 1000), encoding="utf-8")
 
+    with patch("json.load", side_effect=AssertionError("existing content should not be parsed")):
+        local_data_storage._save_as_json(sample_data, str(file_path))
 
-def test_save_as_json_invalid_json_file(local_data_storage, sample_data):
-    mock_file = mock_open(read_data="invalid json content")
+    assert json.loads(file_path.read_text(encoding="utf-8"))[-2:] == sample_data
 
-    with patch("builtins.open", mock_file), patch("os.path.exists", return_value=True):
-        local_data_storage._save_as_json(sample_data, "test_data.json")
+
+def test_save_as_json_invalid_json_file(local_data_storage, sample_data, tmp_path):
+    file_path = tmp_path / "test_data.json"
+    file_path.write_text("invalid json content", encoding="utf-8")
+
+    local_data_storage._save_as_json(sample_data, str(file_path))
 
     # Should still save the new data (existing data ignored due to invalid JSON)
-    handle = mock_file()
-    json.dump(sample_data, handle, indent=4)
-    handle.write.assert_called()
+    assert json.loads(file_path.read_text(encoding="utf-8")) == sample_data
+
+
+@pytest.mark.parametrize("content", ["garbage]", '"text"]', '{"key": [{}]', "]"])
+def test_save_as_json_file_ending_with_bracket_but_not_an_array(local_data_storage, sample_data, tmp_path, content):
+    file_path = tmp_path / "test_data.json"
+    file_path.write_text(content, encoding="utf-8")
+
+    local_data_storage._save_as_json(sample_data, str(file_path))
+
+    assert json.loads(file_path.read_text(encoding="utf-8")) == sample_data
+
+
+@pytest.mark.parametrize("existing_data", [[1, 2], ["a"], [True], [None, 2.5], [[1], "x"]])
+@pytest.mark.parametrize("indent", [None, 4])
+def test_save_as_json_appends_to_scalar_array(local_data_storage, sample_data, tmp_path, existing_data, indent):
+    file_path = tmp_path / "test_data.json"
+    file_path.write_text(json.dumps(existing_data, indent=indent), encoding="utf-8")
+
+    local_data_storage._save_as_json(sample_data, str(file_path))
+
+    assert json.loads(file_path.read_text(encoding="utf-8")) == existing_data + sample_data
+
+
+@pytest.mark.parametrize("content", ['{"x":[1]}', '{"x": 1}', '"text"', "5"])
+def test_save_as_json_refuses_to_overwrite_non_array_json(local_data_storage, sample_data, tmp_path, content):
+    file_path = tmp_path / "test_data.json"
+    file_path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError, match="not an array"):
+        local_data_storage._save_as_json(sample_data, str(file_path))
+
+    assert file_path.read_text(encoding="utf-8") == content
+
+
+@pytest.mark.parametrize(
+    "content", ['[{"team": "Old Team", "odds": 3.0}', "[", '[{"team": "Old Team", "odds": 3.0} \n']
+)
+def test_save_as_json_recovers_array_missing_its_closing_bracket(local_data_storage, sample_data, tmp_path, content):
+    file_path = tmp_path / "test_data.json"
+    file_path.write_text(content, encoding="utf-8")
+
+    local_data_storage._save_as_json(sample_data, str(file_path))
+
+    assert json.loads(file_path.read_text(encoding="utf-8")) == json.loads(content.strip() + "]") + sample_data
+
+
+def test_save_as_json_invalid_json_file_is_replaced_atomically(local_data_storage, sample_data, tmp_path):
+    file_path = tmp_path / "test_data.json"
+    file_path.write_text("invalid json content", encoding="utf-8")
+
+    with patch("os.replace", wraps=os.replace) as mock_replace:
+        local_data_storage._save_as_json(sample_data, str(file_path))
+
+    mock_replace.assert_called_once_with(f"{file_path}.tmp", str(file_path))
+    assert not (tmp_path / "test_data.json.tmp").exists()
 
 
 def test_save_data_invalid_format_type(local_data_storage, sample_data):
@@ -138,15 +254,15 @@ def test_save_data_invalid_format_type(local_data_storage, sample_data):
 
 
 def test_ensure_directory_exists(local_data_storage):
-    with patch("os.path.exists", return_value=False), patch("os.makedirs") as mock_makedirs:
+    with patch("os.makedirs") as mock_makedirs:
         local_data_storage._ensure_directory_exists("data/test_file.csv")
 
-    mock_makedirs.assert_called_once_with("data")
+    mock_makedirs.assert_called_once_with("data", exist_ok=True)
 
 
 def test_ensure_directory_exists_no_directory(local_data_storage):
     """Test when file path has no directory component."""
-    with patch("os.path.exists", return_value=False), patch("os.makedirs") as mock_makedirs:
+    with patch("os.makedirs") as mock_makedirs:
         local_data_storage._ensure_directory_exists("test_file.csv")
 
     # Should not call makedirs when no directory
@@ -154,12 +270,13 @@ def test_ensure_directory_exists_no_directory(local_data_storage):
 
 
 def test_ensure_directory_exists_directory_exists(local_data_storage):
-    """Test when directory already exists."""
-    with patch("os.path.exists", return_value=True), patch("os.makedirs") as mock_makedirs:
+    """Test when directory was already ensured by a previous save."""
+    with patch("os.makedirs") as mock_makedirs:
         local_data_storage._ensure_directory_exists("data/test_file.csv")
+        local_data_storage._ensure_directory_exists("data/other_file.csv")
 
-    # Should not call makedirs when directory exists
-    mock_makedirs.assert_not_called()
+    # Should not call makedirs again for a directory already ensured
+    mock_makedirs.assert_called_once_with("data", exist_ok=True)
 
 
 def test_csv_save_error_handling(local_data_storage, sample_data):
@@ -182,3 +299,477 @@ def test_json_save_error_handling(local_data_storage, sample_data):
             local_data_storage._save_as_json(sample_data, "test_data.json")
 
     mock_logger.assert_called()
+
+
+def test_save_as_jsonl_appends_batch(local_data_storage, sample_data, tmp_path):
+    file_path = tmp_path / "test_data.jsonl"
+    file_path.write_text('{"team": "Old Team", "odds": 3.0}\n', encoding="utf-8")
+
+    local_data_storage._save_as_jsonl([*sample_data, {"team": "Équipe C", "odds": 4.2}], str(file_path))
+
+    lines = file_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"team": "Old Team", "odds": 3.0},
+        *sample_data,
+        {"team": "Équipe C", "odds": 4.2},
+    ]
+
+
+def test_dumps_without_orjson_matches_stdlib():
+    record = {"team": "Équipe A", "odds": 2.5, 1: None}
+
+    with patch("src.storage.local_data_storage._import_orjson", return_value=None):
+        encoded = _dumps(record)
+
+    assert encoded == json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def test_dumps_falls_back_for_values_orjson_rejects():
+    record = {"big": 2**70}
+
+    assert json.loads(_dumps(record)) == record
+
+
+@pytest.mark.skipif(not hasattr(os, "writev"), reason="os.writev is not available on this platform")
+def test_save_as_jsonl_gather_write(local_data_storage, sample_data, tmp_path):
+    file_path = tmp_path / "test_data.jsonl"
+
+    with patch("os.writev", wraps=os.writev) as mock_writev, patch("os.write") as mock_write:
+        local_data_storage._save_as_jsonl(sample_data, str(file_path))
+
+    mock_writev.assert_called_once()
+    mock_write.assert_not_called()
+    assert [json.loads(line) for line in file_path.read_text(encoding="utf-8").splitlines()] == sample_data
+
+
+@pytest.mark.skipif(not hasattr(os, "writev"), reason="os.writev is not available on this platform")
+def test_append_buffers_chunks_by_iov_max_and_finishes_short_writes(local_data_storage, tmp_path):
+    file_path = tmp_path / "test_data.jsonl"
+    buffers = [f"{index}\n".encode() for index in range(5)]
+    real_writev = os.writev
+
+    def short_writev(fd, chunk):
+        # Only the first buffer of each chunk makes it through
+        return real_writev(fd, chunk[:1])
+
+    with (
+        patch("src.storage.local_data_storage._IOV_MAX", 2),
+        patch("os.writev", side_effect=short_writev) as mock_writev,
+    ):
+        local_data_storage._append_buffers(str(file_path), buffers)
+
+    assert mock_writev.call_count == 3
+    assert file_path.read_bytes() == b"".join(buffers)
+
+
+def test_append_buffers_without_writev(local_data_storage, tmp_path):
+    file_path = tmp_path / "test_data.jsonl"
+
+    with patch("src.storage.local_data_storage.os", wraps=os) as mock_os:
+        del mock_os.writev
+        local_data_storage._append_buffers(str(file_path), [b"a\n", b"b\n"])
+
+    assert file_path.read_bytes() == b"a\nb\n"
+
+
+def test_write_all_retries_short_writes(tmp_path):
+    file_path = tmp_path / "test_data.jsonl"
+    real_write = os.write
+
+    def short_write(fd, data):
+        return real_write(fd, bytes(data[:3]))
+
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT)
+    try:
+        with patch("os.write", side_effect=short_write) as mock_write:
+            _write_all(fd, b"0123456789")
+    finally:
+        os.close(fd)
+
+    assert file_path.read_bytes() == b"0123456789"
+    assert mock_write.call_count == 4
+
+
+def test_save_as_jsonl_empty_batch(local_data_storage, tmp_path):
+    file_path = tmp_path / "test_data.jsonl"
+
+    local_data_storage._save_as_jsonl([], str(file_path))
+
+    assert file_path.read_bytes() == b""
+
+
+@pytest.mark.parametrize(
+    ("storage_format", "save_method"),
+    [
+        (StorageFormat.CSV, "_save_as_csv"),
+        ("JSON", "_save_as_json"),
+        (StorageFormat.JSONL, "_save_as_jsonl"),
+    ],
+)
+def test_save_data_dispatches_by_format(local_data_storage, sample_data, storage_format, save_method):
+    with patch.object(local_data_storage, save_method) as mock_save:
+        local_data_storage.save_data(sample_data, file_path="test", storage_format=storage_format)
+
+    extension = storage_format.value if isinstance(storage_format, StorageFormat) else storage_format.lower()
+    mock_save.assert_called_once_with(sample_data, f"test.{extension}")
+
+
+@pytest.mark.parametrize(
+    ("file_path", "storage_format", "expected_path"),
+    [
+        ("output", "json", "output.json"),
+        ("output.json", "json", "output.json"),
+        ("output.json", "jsonl", "output.json.jsonl"),
+        ("output.jsonl", StorageFormat.JSONL, "output.jsonl"),
+    ],
+)
+def test_resolve_target_file_path_suffix(local_data_storage, file_path, storage_format, expected_path):
+    target_file_path, _ = local_data_storage.resolve_target_file_path(file_path, storage_format)
+
+    assert target_file_path == expected_path
+
+
+def test_save_as_csv_missing_and_single_columns(local_data_storage, tmp_path):
+    file_path = tmp_path / "test_data.csv"
+    single_column_path = tmp_path / "single.csv"
+
+    local_data_storage._save_as_csv([{"team": "Team A", "odds": 2.5}, {"team": "Team B"}], str(file_path))
+    local_data_storage._save_as_csv([{"team": "Team A"}, {"team": "Team B"}], str(single_column_path))
+
+    assert file_path.read_text(encoding="utf-8").splitlines() == ["team,odds", "Team A,2.5", "Team B,"]
+    assert single_column_path.read_text(encoding="utf-8").splitlines() == ["team", "Team A", "Team B"]
+
+
+@pytest.mark.asyncio
+async def test_save_data_async(local_data_storage, sample_data, tmp_path):
+    file_path = tmp_path / "test_data.jsonl"
+
+    await asyncio.gather(
+        *(local_data_storage.save_data_async(record, str(file_path), StorageFormat.JSONL) for record in sample_data)
+    )
+
+    lines = file_path.read_text(encoding="utf-8").splitlines()
+    assert sorted(json.loads(line)["team"] for line in lines) == ["Team A", "Team B"]
+
+
+@pytest.mark.asyncio
+async def test_save_data_async_propagates_errors(local_data_storage):
+    with pytest.raises(ValueError, match="Data must be a dictionary or a list of dictionaries."):
+        await local_data_storage.save_data_async("invalid_data")
+
+
+def test_save_as_jsonl_writes_raw_utf8(local_data_storage, tmp_path):
+    file_path = tmp_path / "test_data.jsonl"
+
+    local_data_storage._save_as_jsonl([{"team": "Beşiktaş"}], str(file_path))
+
+    assert file_path.read_bytes() == '{"team":"Beşiktaş"}\n'.encode()
+
+
+@pytest.mark.parametrize(("storage_format", "expected_content"), [("json", b"[]"), ("jsonl", b"")])
+def test_reset_json_file(local_data_storage, tmp_path, storage_format, expected_content):
+    file_path = tmp_path / "out" / f"test_data.{storage_format}"
+    file_path.parent.mkdir()
+    file_path.write_bytes(b'{"team":"Old Team"}\n')
+
+    with patch("os.replace", wraps=os.replace) as mock_replace:
+        target_file_path = local_data_storage.reset_json_file(str(file_path), storage_format)
+
+    assert target_file_path == str(file_path)
+    mock_replace.assert_called_once_with(f"{file_path}.tmp", str(file_path))
+    assert file_path.read_bytes() == expected_content
+
+
+def test_reset_json_file_unsupported_format(local_data_storage):
+    with pytest.raises(ValueError, match="reset_json_file is only supported for JSON/JSONL format."):
+        local_data_storage.reset_json_file("test_data", "csv")
+
+
+def test_sync_fsyncs_written_files(local_data_storage, sample_data, tmp_path):
+    csv_path = str(tmp_path / "test_data.csv")
+    json_path = str(tmp_path / "test_data.json")
+    local_data_storage.save_data(sample_data, csv_path, "csv")
+    local_data_storage.save_data(sample_data, json_path, "json")
+
+    with patch("os.fsync") as mock_fsync:
+        local_data_storage.sync()
+        local_data_storage.sync()
+
+    assert mock_fsync.call_count == 2
+    assert local_data_storage._unsynced_paths == set()
+
+
+def test_save_as_csv_does_not_stat_for_header(local_data_storage, sample_data, tmp_path):
+    file_path = str(tmp_path / "test_data.csv")
+
+    with patch("os.path.getsize") as mock_getsize, patch("os.stat", wraps=os.stat) as mock_stat:
+        local_data_storage._save_as_csv(sample_data, file_path)
+        mock_stat.reset_mock()
+        local_data_storage._save_as_csv(sample_data, file_path)
+
+    mock_getsize.assert_not_called()
+    mock_stat.assert_not_called()
+    assert (tmp_path / "test_data.csv").read_text(encoding="utf-8").count("team,odds") == 1
+
+
+def test_save_batch_writes_each_file_once(local_data_storage, sample_data, tmp_path):
+    csv_path = str(tmp_path / "league_a.csv")
+    jsonl_path = str(tmp_path / "league_b")
+
+    with patch.object(local_data_storage, "_write", wraps=local_data_storage._write) as mock_write:
+        local_data_storage.save_batch(
+            [
+                (csv_path, sample_data[0], "csv"),
+                (jsonl_path, sample_data, StorageFormat.JSONL),
+                (csv_path, sample_data[1:], "csv"),
+            ]
+        )
+
+    assert mock_write.call_count == 2
+    assert (tmp_path / "league_a.csv").read_text(encoding="utf-8").splitlines() == [
+        "team,odds",
+        "Team A,2.5",
+        "Team B,1.8",
+    ]
+    lines = (tmp_path / "league_b.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == sample_data
+
+
+def test_save_batch_keeps_mixed_csv_columns(local_data_storage, tmp_path):
+    file_path = str(tmp_path / "test_data.csv")
+
+    local_data_storage.save_batch(
+        [
+            (file_path, [{"team": "A", "odds": 1}], "csv"),
+            (file_path, [{"home": "X", "away": "Y"}], "csv"),
+            (file_path, [{"home": "Z", "away": "W"}], "csv"),
+            (str(tmp_path / "other.jsonl"), [{"team": "B"}], "jsonl"),
+        ]
+    )
+
+    assert (tmp_path / "test_data.csv").read_text(encoding="utf-8").splitlines() == ["team,odds", "A,1", "X,Y", "Z,W"]
+
+
+def test_save_batch_validates_before_writing(local_data_storage, sample_data, tmp_path):
+    with patch.object(local_data_storage, "_write") as mock_write:
+        with pytest.raises(ValueError, match="Invalid storage format"):
+            local_data_storage.save_batch([(str(tmp_path / "a"), sample_data, "csv"), ("b", sample_data, "xml")])
+
+    mock_write.assert_not_called()
+
+
+def test_save_batch_propagates_write_errors(local_data_storage, sample_data, tmp_path):
+    writes = [(str(tmp_path / "a"), sample_data, "jsonl"), (str(tmp_path / "b"), sample_data, "jsonl")]
+
+    with patch.object(local_data_storage, "_save_as_jsonl", side_effect=OSError("disk full")):
+        with pytest.raises(OSError, match="disk full"):
+            local_data_storage.save_batch(writes)
+
+
+def test_csv_handles_are_bounded(sample_data, tmp_path):
+    storage = LocalDataStorage(max_open_files=2)
+    paths = [str(tmp_path / f"league_{index}.csv") for index in range(3)]
+
+    storage._save_as_csv(sample_data, paths[0])
+    first_handle = storage._csv_handles[paths[0]][0]
+    storage._save_as_csv(sample_data, paths[1])
+    storage._save_as_csv(sample_data, paths[0])
+    storage._save_as_csv(sample_data, paths[2])
+
+    # league_1 was the least recently used file, so it is the one closed
+    assert list(storage._csv_handles) == [paths[0], paths[2]]
+    assert not first_handle.closed
+
+    storage._save_as_csv(sample_data, paths[1])
+    assert (tmp_path / "league_1.csv").read_text(encoding="utf-8").count("team,odds") == 1
+
+    storage.close()
+    assert first_handle.closed
+
+
+def test_background_writes(sample_data, tmp_path):
+    storage = LocalDataStorage(background_writes=True)
+    file_path = str(tmp_path / "test_data.jsonl")
+
+    for record in sample_data * 50:
+        storage.append_jsonl_record(record, file_path, "jsonl")
+    storage.flush()
+
+    lines = (tmp_path / "test_data.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == sample_data * 50
+
+    storage.close()
+    assert storage._writer_thread is None
+
+
+def test_background_write_errors_surface_on_flush(sample_data, tmp_path):
+    storage = LocalDataStorage(background_writes=True)
+
+    with patch.object(storage, "_append_to_json_array", side_effect=OSError("disk full")):
+        storage.save_data(sample_data, str(tmp_path / "test_data"), "json")
+        with pytest.raises(OSError, match="disk full"):
+            storage.flush()
+
+    # The error is reported once
+    storage.flush()
+    storage.close()
+
+
+def test_background_writes_drained_before_reset(sample_data, tmp_path):
+    storage = LocalDataStorage(background_writes=True)
+    file_path = str(tmp_path / "test_data.json")
+
+    storage.save_data(sample_data, file_path, "json")
+    storage.reset_json_file(file_path, "json")
+    storage.close()
+
+    assert json.loads((tmp_path / "test_data.json").read_text(encoding="utf-8")) == []
+
+
+def test_save_as_json_compact_by_default(local_data_storage, sample_data, tmp_path):
+    file_path = tmp_path / "test_data.json"
+
+    local_data_storage._save_as_json(sample_data, str(file_path))
+
+    assert file_path.read_text(encoding="utf-8") == json.dumps(sample_data, separators=(",", ":"))
+
+
+def test_save_as_json_pretty(sample_data, tmp_path):
+    storage = LocalDataStorage(pretty_json=True)
+    file_path = tmp_path / "test_data.json"
+    file_path.write_text("[]", encoding="utf-8")
+
+    storage._save_as_json(sample_data[:1], str(file_path))
+    storage._save_as_json(sample_data[1:], str(file_path))
+
+    assert file_path.read_text(encoding="utf-8") == json.dumps(sample_data, indent=4)
+
+
+def test_background_writes_keep_mixed_csv_columns(tmp_path):
+    storage = LocalDataStorage(background_writes=True)
+    file_path = str(tmp_path / "test_data.csv")
+
+    storage.save_data({"team": "A", "odds": 1}, file_path, "csv")
+    storage.save_data({"home": "X", "away": "Y"}, file_path, "csv")
+    storage.close()
+
+    assert (tmp_path / "test_data.csv").read_text(encoding="utf-8").splitlines() == ["team,odds", "A,1", "X,Y"]
+
+
+def test_group_writes_splits_csv_batches_on_column_change():
+    grouped = _group_writes(
+        [
+            ([{"team": "A"}], "a.csv", "csv"),
+            ([{"team": "B"}], "a.csv", "csv"),
+            ([{"home": "X"}], "a.csv", "csv"),
+            ([{"team": "C"}], "b.jsonl", "jsonl"),
+            ([{"home": "Y"}], "b.jsonl", "jsonl"),
+        ]
+    )
+
+    assert grouped == {
+        "a.csv": ("csv", [[{"team": "A"}, {"team": "B"}], [{"home": "X"}]]),
+        "b.jsonl": ("jsonl", [[{"team": "C"}, {"home": "Y"}]]),
+    }
+
+
+def test_background_writes_copy_the_saved_list(tmp_path):
+    storage = LocalDataStorage(background_writes=True)
+    file_path = str(tmp_path / "test_data.jsonl")
+    records = [{"a": "original"}]
+
+    with storage._lock_for(file_path):
+        storage.save_data(records, file_path, "jsonl")
+        records.clear()
+        records.append({"a": "MUTATED"})
+    storage.close()
+
+    assert (tmp_path / "test_data.jsonl").read_text(encoding="utf-8") == '{"a":"original"}\n'
+
+
+def test_background_writes_serialize_records_when_saved(tmp_path):
+    storage = LocalDataStorage(background_writes=True)
+    paths = {fmt: str(tmp_path / f"test_data.{fmt}") for fmt in ("csv", "json", "jsonl")}
+    record = {"team": "original", "odds": 2.5}
+
+    with storage._lock_for(paths["csv"]), storage._lock_for(paths["json"]), storage._lock_for(paths["jsonl"]):
+        for fmt, path in paths.items():
+            storage.save_data(record, path, fmt)
+        record["team"] = "MUTATED"
+    storage.close()
+
+    assert (tmp_path / "test_data.csv").read_text(encoding="utf-8").splitlines() == ["team,odds", "original,2.5"]
+    assert json.loads((tmp_path / "test_data.json").read_text(encoding="utf-8")) == [{"team": "original", "odds": 2.5}]
+    assert (tmp_path / "test_data.jsonl").read_text(encoding="utf-8") == '{"team":"original","odds":2.5}\n'
+
+
+def test_background_writes_reject_invalid_csv_records_when_saved(tmp_path):
+    storage = LocalDataStorage(background_writes=True)
+
+    with pytest.raises(ValueError, match="dict contains fields not in fieldnames: 'home'"):
+        storage.save_data([{"team": "A"}, {"team": "B", "home": "X"}], str(tmp_path / "test_data.csv"), "csv")
+
+    storage.close()
+    assert not (tmp_path / "test_data.csv").exists()
+
+
+def test_background_writer_stops_when_storage_is_collected(sample_data, tmp_path):
+    storage = LocalDataStorage(background_writes=True)
+    writer_thread = storage._writer_thread
+    storage.save_data(sample_data, str(tmp_path / "test_data.jsonl"), "jsonl")
+    storage.flush()
+
+    del storage
+    gc.collect()
+    writer_thread.join(timeout=5)
+
+    assert not writer_thread.is_alive()
+    assert len((tmp_path / "test_data.jsonl").read_text(encoding="utf-8").splitlines()) == len(sample_data)
+
+
+def test_save_as_csv_rejects_extra_columns(local_data_storage, tmp_path):
+    file_path = tmp_path / "test_data.csv"
+
+    with pytest.raises(ValueError, match="dict contains fields not in fieldnames: 'home', 'away'"):
+        local_data_storage._save_as_csv(
+            [{"team": "Team A"}, {"team": "Team B", "home": "X", "away": "Y"}], str(file_path)
+        )
+
+    # Rows are built before the file is opened, so nothing from the rejected batch is written
+    assert not file_path.exists()
+
+
+def test_save_data_csv_empty_record(local_data_storage, tmp_path):
+    file_path = tmp_path / "test_data.csv"
+
+    local_data_storage.save_data([{}], str(file_path), "csv")
+
+    assert file_path.read_bytes() == b"\r\n\r\n"
+
+
+def test_evicted_csv_handles_are_closed_after_the_write(sample_data, tmp_path):
+    storage = LocalDataStorage(max_open_files=1)
+    first_path = str(tmp_path / "league_a.csv")
+
+    storage.save_data(sample_data, first_path, "csv")
+    first_handle = storage._csv_handles[first_path][0]
+    storage.save_data(sample_data, str(tmp_path / "league_b.csv"), "csv")
+
+    assert first_handle.closed
+    assert storage._csv_handles.evicted == []
+
+
+def test_csv_rows_are_written_without_the_cache_lock(local_data_storage, sample_data, tmp_path):
+    lock_states = []
+
+    def row_getter(fieldnames):
+        def get_row(record):
+            lock_states.append(local_data_storage._csv_lock.locked())
+            return tuple(record[name] for name in fieldnames)
+
+        return get_row
+
+    with patch("src.storage.local_data_storage._csv_row_getter", side_effect=row_getter):
+        local_data_storage.save_data(sample_data, str(tmp_path / "test_data.csv"), "csv")
+
+    assert lock_states == [False, False]